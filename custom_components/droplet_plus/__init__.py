@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryNotReady
 
 from .const import DOMAIN
@@ -14,6 +15,8 @@ from .coordinator import DropletCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Each platform sets PARALLEL_UPDATES: 0 for read-only coordinator
+# platforms, 1 for platforms that write (number)
 PLATFORMS = [
     Platform.BINARY_SENSOR,
     Platform.EVENT,
@@ -29,7 +32,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: DropletConfigEntry) -> b
     coordinator = DropletCoordinator(hass, entry)
 
     try:
-        await coordinator.async_setup()
+        await coordinator.async_connect()
     except Exception as err:
         _LOGGER.error("Failed to set up Droplet: %s", err)
         raise ConfigEntryNotReady(
@@ -39,10 +42,30 @@ async def async_setup_entry(hass: HomeAssistant, entry: DropletConfigEntry) -> b
 
     entry.runtime_data = coordinator
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Option and unit system changes apply without reloading the entry
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    @callback
+    def _async_core_config_updated(_event: Event) -> None:
+        coordinator.async_apply_options()
+
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, _async_core_config_updated)
+    )
+
+    # Load entity platforms while the first refresh waits for device metadata
+    await asyncio.gather(
+        coordinator.async_config_entry_first_refresh(),
+        hass.config_entries.async_forward_entry_setups(entry, PLATFORMS),
+    )
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: DropletConfigEntry) -> None:
+    """Handle config entry updates."""
+    entry.runtime_data.async_apply_options()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: DropletConfigEntry) -> bool:
     """Unload a config entry."""
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
@@ -3,17 +3,20 @@
 from __future__ import annotations
 
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DropletConfigEntry
-from .const import DOMAIN, KEY_WATER_LEAK
+from .const import KEY_WATER_LEAK
 from .coordinator import DropletCoordinator
 
+# Read-only coordinator entity: no per-entity polling to throttle
+# (quality scale rule: parallel-updates)
 PARALLEL_UPDATES = 0
 
+_UNIQUE_ID_SUFFIX = f"_{KEY_WATER_LEAK}"
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -35,17 +38,17 @@ class DropletLeakSensor(CoordinatorEntity[DropletCoordinator], BinarySensorEntit
     def __init__(self, coordinator: DropletCoordinator) -> None:
         """Initialize the binary sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.unique_id}_{KEY_WATER_LEAK}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-        )
+        self._attr_unique_id = coordinator.unique_id + _UNIQUE_ID_SUFFIX
+        self._attr_device_info = coordinator.device_info
+        self._attr_is_on = coordinator.water_leak_detected
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
         return self.coordinator.available
 
-    @property
-    def is_on(self) -> bool:
-        """Return True if a water leak is detected."""
-        return self.coordinator.water_leak_detected
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Cache the leak state from the coordinator."""
+        self._attr_is_on = self.coordinator.water_leak_detected
+        self.async_write_ha_state()
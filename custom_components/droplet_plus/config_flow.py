@@ -2,18 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 import logging
 from typing import Any
 
+from aiohttp import ClientError, ClientSession
 from pydroplet.droplet import DropletConnection, DropletDiscovery
 import voluptuous as vol
 
-from homeassistant.config_entries import (
-    ConfigEntry,
-    ConfigFlow,
-    ConfigFlowResult,
-    OptionsFlowWithConfigEntry,
-)
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TOKEN
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.selector import (
@@ -30,21 +28,73 @@ from .const import (
     CONF_DEVICE_ID,
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
+    CONNECT_TIMEOUT,
     DEFAULT_WATER_LEAK_THRESHOLD,
     DEFAULT_WATER_TARIFF,
     DOMAIN,
 )
-from .helpers import normalize_pairing_code
+from .helpers import is_valid_pairing_code, normalize_pairing_code
 
 _LOGGER = logging.getLogger(__name__)
 
+_HOST_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT))
+_TOKEN_SELECTOR = TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD))
+_WATER_TARIFF_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=0, max=100, step=0.01, mode=NumberSelectorMode.BOX)
+)
+_LEAK_THRESHOLD_SELECTOR = NumberSelector(
+    NumberSelectorConfig(min=0, max=10, step=0.01, mode=NumberSelectorMode.BOX)
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_HOST): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
-        vol.Required(CONF_TOKEN): TextSelector(TextSelectorConfig(type=TextSelectorType.PASSWORD)),
+        vol.Required(CONF_HOST): _HOST_SELECTOR,
+        vol.Required(CONF_TOKEN): _TOKEN_SELECTOR,
+    }
+)
+
+STEP_CONFIRM_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_TOKEN): _TOKEN_SELECTOR,
     }
 )
 
+STEP_RECONFIGURE_DATA_SCHEMA = STEP_USER_DATA_SCHEMA
+
+STEP_OPTIONS_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_WATER_TARIFF, default=DEFAULT_WATER_TARIFF): _WATER_TARIFF_SELECTOR,
+        vol.Required(CONF_WATER_LEAK_THRESHOLD, default=DEFAULT_WATER_LEAK_THRESHOLD): (
+            _LEAK_THRESHOLD_SELECTOR
+        ),
+    }
+)
+
+_STEP_SCHEMAS: dict[str, vol.Schema] = {
+    "user": STEP_USER_DATA_SCHEMA,
+    "confirm": STEP_CONFIRM_DATA_SCHEMA,
+    "reconfigure": STEP_RECONFIGURE_DATA_SCHEMA,
+}
+
+
+async def _async_connect_and_identify(
+    discovery: DropletDiscovery,
+    session: ClientSession,
+    token: str,
+    device_id: str | None = None,
+) -> str | None:
+    """Validate the pairing code and return the device ID from the same handshake.
+
+    pydroplet records the device ID when it is part of the first WebSocket
+    message, in which case get_device_id() returns without further I/O.
+    A device_id already known from discovery skips the lookup entirely.
+    """
+    if not await discovery.try_connect(session, token):
+        return None
+    if device_id:
+        return device_id
+    return await discovery.get_device_id()
+
 
 class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Droplet."""
@@ -58,39 +108,22 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
         self._token: str | None = None
         self._device_id: str | None = None
         self._service_name: str | None = None
+        self._token_cache: tuple[str, str] | None = None
 
     @staticmethod
     def async_get_options_flow(
         config_entry: ConfigEntry,
     ) -> DropletOptionsFlow:
         """Get the options flow for this handler."""
-        return DropletOptionsFlow(config_entry)
+        return DropletOptionsFlow()
 
     async def async_step_user(
         self,
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
         """Handle the initial step (manual setup)."""
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            host = user_input[CONF_HOST]
-            token = normalize_pairing_code(user_input[CONF_TOKEN])
-
-            device_id = await self._async_try_connect(host, self._port, token, errors)
-            if device_id:
-                await self.async_set_unique_id(device_id)
-                self._abort_if_unique_id_configured()
-
-                self._host = host
-                self._token = token
-                self._device_id = device_id
-                return await self.async_step_options()
-
-        return self.async_show_form(
-            step_id="user",
-            data_schema=STEP_USER_DATA_SCHEMA,
-            errors=errors,
+        return await self._async_handle_token_step(
+            "user", None, user_input, self._async_create_from_token
         )
 
     async def async_step_zeroconf(
@@ -98,19 +131,29 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
         discovery_info: ZeroconfServiceInfo,
     ) -> ConfigFlowResult:
         """Handle zeroconf discovery."""
-        self._host = str(discovery_info.host)
-        self._port = discovery_info.port or DropletConnection.DEFAULT_PORT
+        host = str(discovery_info.host)
+        port = discovery_info.port or DropletConnection.DEFAULT_PORT
+
+        # Repeat announcements of a configured device need no flow state
+        for entry in self._async_current_entries(include_ignore=False):
+            if entry.data.get(CONF_HOST) == host and entry.data.get(CONF_PORT) == port:
+                return self.async_abort(reason="already_configured")
+
+        self._host = host
+        self._port = port
         self._service_name = discovery_info.name
 
-        _LOGGER.debug(
-            "Zeroconf discovered Droplet at %s:%s (%s)",
-            self._host,
-            self._port,
-            self._service_name,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Zeroconf discovered Droplet at %s:%s (%s)",
+                self._host,
+                self._port,
+                self._service_name,
+            )
 
-        # Use service name as a preliminary unique ID
-        await self.async_set_unique_id(self._service_name)
+        # The mDNS instance name is "<device_id>._droplet._tcp.local."
+        self._device_id = self._service_name.split(".", 1)[0] or None
+        await self.async_set_unique_id(self._device_id or self._service_name)
         self._abort_if_unique_id_configured(updates={CONF_HOST: self._host, CONF_PORT: self._port})
 
         self.context["title_placeholders"] = {"host": self._host}
@@ -124,30 +167,11 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
         host = self._host  # Set by async_step_zeroconf
         if host is None:
             return self.async_abort(reason="unknown")
-        errors: dict[str, str] = {}
-
-        if user_input is not None:
-            token = normalize_pairing_code(user_input[CONF_TOKEN])
-
-            device_id = await self._async_try_connect(host, self._port, token, errors)
-            if device_id:
-                await self.async_set_unique_id(device_id)
-                self._abort_if_unique_id_configured()
-
-                self._token = token
-                self._device_id = device_id
-                return await self.async_step_options()
-
-        return self.async_show_form(
-            step_id="confirm",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(CONF_TOKEN): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                }
-            ),
-            errors=errors,
+        return await self._async_handle_token_step(
+            "confirm",
+            host,
+            user_input,
+            self._async_create_from_token,
             description_placeholders={"host": host},
         )
 
@@ -173,32 +197,7 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="options",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_WATER_TARIFF,
-                        default=DEFAULT_WATER_TARIFF,
-                    ): NumberSelector(
-                        NumberSelectorConfig(
-                            min=0,
-                            max=100,
-                            step=0.01,
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_WATER_LEAK_THRESHOLD,
-                        default=DEFAULT_WATER_LEAK_THRESHOLD,
-                    ): NumberSelector(
-                        NumberSelectorConfig(
-                            min=0,
-                            max=10,
-                            step=0.01,
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    ),
-                }
-            ),
+            data_schema=STEP_OPTIONS_DATA_SCHEMA,
         )
 
     async def async_step_reconfigure(
@@ -206,68 +205,124 @@ class DropletConfigFlow(ConfigFlow, domain=DOMAIN):
         user_input: dict[str, Any] | None = None,
     ) -> ConfigFlowResult:
         """Handle reconfiguration of the integration."""
-        reconfigure_entry = self._get_reconfigure_entry()
+        return await self._async_handle_token_step(
+            "reconfigure",
+            None,
+            user_input,
+            self._async_update_from_token,
+            suggested_values={CONF_HOST: self._get_reconfigure_entry().data.get(CONF_HOST)},
+        )
+
+    async def _async_handle_token_step(
+        self,
+        step_id: str,
+        host: str | None,
+        user_input: dict[str, Any] | None,
+        on_success: Callable[[str, str, str], Awaitable[ConfigFlowResult]],
+        *,
+        suggested_values: dict[str, Any] | None = None,
+        description_placeholders: dict[str, str] | None = None,
+    ) -> ConfigFlowResult:
+        """Validate a submitted pairing code and advance, or show the step form."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
-            host = user_input[CONF_HOST]
-            token = normalize_pairing_code(user_input[CONF_TOKEN])
+            host = user_input.get(CONF_HOST, host)
+            token = self._normalize_token(user_input[CONF_TOKEN])
 
-            device_id = await self._async_try_connect(host, self._port, token, errors)
+            device_id = await self._async_try_connect(
+                host, self._port, token, errors, self._device_id
+            )
             if device_id:
-                await self.async_set_unique_id(device_id)
-                self._abort_if_unique_id_mismatch()
-
-                return self.async_update_reload_and_abort(
-                    reconfigure_entry,
-                    title=f"Droplet ({host})",
-                    data_updates={
-                        CONF_HOST: host,
-                        CONF_PORT: self._port,
-                        CONF_TOKEN: token,
-                        CONF_DEVICE_ID: device_id,
-                    },
-                )
+                return await on_success(host, token, device_id)
+
+        data_schema = _STEP_SCHEMAS[step_id]
+        if suggested_values is not None:
+            data_schema = self.add_suggested_values_to_schema(data_schema, suggested_values)
 
         return self.async_show_form(
-            step_id="reconfigure",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_HOST,
-                        default=reconfigure_entry.data.get(CONF_HOST),
-                    ): TextSelector(TextSelectorConfig(type=TextSelectorType.TEXT)),
-                    vol.Required(CONF_TOKEN): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                }
-            ),
+            step_id=step_id,
+            data_schema=data_schema,
             errors=errors,
+            description_placeholders=description_placeholders,
+        )
+
+    async def _async_create_from_token(
+        self, host: str, token: str, device_id: str
+    ) -> ConfigFlowResult:
+        """Store a validated connection and continue to the options step."""
+        if self.unique_id != device_id:
+            await self.async_set_unique_id(device_id)
+            self._abort_if_unique_id_configured()
+
+        self._host = host
+        self._token = token
+        self._device_id = device_id
+        return await self.async_step_options()
+
+    async def _async_update_from_token(
+        self, host: str, token: str, device_id: str
+    ) -> ConfigFlowResult:
+        """Apply a validated connection to the entry being reconfigured."""
+        await self.async_set_unique_id(device_id)
+        self._abort_if_unique_id_mismatch()
+
+        return self.async_update_reload_and_abort(
+            self._get_reconfigure_entry(),
+            title=f"Droplet ({host})",
+            data_updates={
+                CONF_HOST: host,
+                CONF_PORT: self._port,
+                CONF_TOKEN: token,
+                CONF_DEVICE_ID: device_id,
+            },
         )
 
+    def _normalize_token(self, raw: str) -> str:
+        """Normalize a pairing code, reusing the result for repeated submissions."""
+        if self._token_cache is None or self._token_cache[0] != raw:
+            self._token_cache = (raw, normalize_pairing_code(raw))
+        return self._token_cache[1]
+
     async def _async_try_connect(
         self,
         host: str,
         port: int,
         token: str,
         errors: dict[str, str],
+        device_id: str | None = None,
     ) -> str | None:
         """Try connecting to the device, return device_id or None on failure."""
+        if not is_valid_pairing_code(token):
+            errors[CONF_TOKEN] = "invalid_token"
+            return None
+
         session = async_get_clientsession(self.hass)
         discovery = DropletDiscovery(host, port, "")
 
         try:
-            if not await discovery.try_connect(session, token):
-                errors["base"] = "cannot_connect"
-                return None
-            return await discovery.get_device_id()
+            async with asyncio.timeout(CONNECT_TIMEOUT):
+                device_id = await _async_connect_and_identify(discovery, session, token, device_id)
+        except TimeoutError:
+            _LOGGER.debug("Timeout connecting to Droplet at %s:%s", host, port)
+            errors["base"] = "timeout"
+            return None
+        except ClientError as err:
+            _LOGGER.debug("Error connecting to Droplet at %s:%s: %s", host, port, err)
+            errors["base"] = "cannot_connect"
+            return None
         except Exception:
             _LOGGER.exception("Error connecting to Droplet at %s:%s", host, port)
             errors["base"] = "cannot_connect"
             return None
 
+        if not device_id:
+            errors["base"] = "cannot_connect"
+            return None
+        return device_id
+
 
-class DropletOptionsFlow(OptionsFlowWithConfigEntry):
+class DropletOptionsFlow(OptionsFlow):
     """Handle Droplet options flow."""
 
     async def async_step_init(
@@ -278,37 +333,9 @@ class DropletOptionsFlow(OptionsFlowWithConfigEntry):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        current = self.config_entry.options
-
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Required(
-                        CONF_WATER_TARIFF,
-                        default=current.get(CONF_WATER_TARIFF, DEFAULT_WATER_TARIFF),
-                    ): NumberSelector(
-                        NumberSelectorConfig(
-                            min=0,
-                            max=100,
-                            step=0.01,
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    ),
-                    vol.Required(
-                        CONF_WATER_LEAK_THRESHOLD,
-                        default=current.get(
-                            CONF_WATER_LEAK_THRESHOLD,
-                            DEFAULT_WATER_LEAK_THRESHOLD,
-                        ),
-                    ): NumberSelector(
-                        NumberSelectorConfig(
-                            min=0,
-                            max=10,
-                            step=0.01,
-                            mode=NumberSelectorMode.BOX,
-                        )
-                    ),
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_OPTIONS_DATA_SCHEMA, self.config_entry.options
             ),
         )
@@ -18,13 +18,16 @@ CONF_WATER_LEAK_THRESHOLD: Final = "water_leak_threshold"
 # Defaults
 DEFAULT_WATER_TARIFF: Final = 0.0
 DEFAULT_WATER_LEAK_THRESHOLD: Final = 0.0
+OPTIONS_WRITE_COOLDOWN: Final = 0.2
 
 # Connection
 CONNECT_DELAY: Final = 5
+CONNECT_TIMEOUT: Final = 10
 FW_VERSION_TIMEOUT: Final = 5
 
 # Storage
 STORAGE_VERSION: Final = 1
+STORAGE_MINOR_VERSION: Final = 2
 STORAGE_KEY: Final = f"{DOMAIN}_data"
 SAVE_INTERVAL: Final = 300
 
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from array import array
 import asyncio
+from collections import deque
+from collections.abc import Iterable, Iterator
 import contextlib
-from datetime import datetime, timedelta
+from datetime import datetime
 import logging
 import time
 from typing import Any
@@ -13,9 +16,12 @@ from pydroplet.droplet import Droplet
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TOKEN
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.issue_registry import (
     IssueSeverity,
     async_create_issue,
@@ -40,23 +46,30 @@ from .const import (
     L_TO_GAL,
     L_TO_M3,
     ML_TO_L,
+    OPTIONS_WRITE_COOLDOWN,
     SAVE_INTERVAL,
     STORAGE_KEY,
+    STORAGE_MINOR_VERSION,
     STORAGE_VERSION,
 )
 from .helpers import (
-    compute_average,
-    compute_max,
-    is_new_day,
-    is_new_hour,
-    is_new_month,
-    is_new_week,
-    is_new_year,
+    BOUNDARY_DAY,
+    BOUNDARY_HOUR,
+    BOUNDARY_MONTH,
+    BOUNDARY_WEEK,
+    BOUNDARY_YEAR,
+    RollingWindow,
+    crossed_boundaries,
+    from_columns,
     next_day,
     next_hour,
     next_month,
     next_week,
     next_year,
+    pack_floats,
+    to_columns,
+    trim_expired,
+    unpack_floats,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -64,6 +77,90 @@ _LOGGER = logging.getLogger(__name__)
 HOUR_SECONDS = 3600
 DAY_SECONDS = 86400
 WEEK_SECONDS = 604800
+MONTH_SECONDS = DAY_SECONDS * 30
+HOURS_PER_DAY = DAY_SECONDS // HOUR_SECONDS
+HOURS_PER_WEEK = WEEK_SECONDS // HOUR_SECONDS
+DAYS_PER_WEEK = WEEK_SECONDS // DAY_SECONDS
+DAYS_PER_MONTH = MONTH_SECONDS // DAY_SECONDS
+# Memory guard for the 1h flow window: twice the samples a 1 Hz feed produces,
+# so a faster feed is still expired by age rather than cut short by count
+FLOW_SAMPLES_MAX = 2 * HOUR_SECONDS
+_INV_ML_TO_L = 1.0 / ML_TO_L
+
+# Rounding precision of the 1h average flow, also checked on idle frames
+_AVG_FLOW_PRECISION = 3
+
+# Values published to sensors, with their rounding precision
+_ROUNDED_VALUES: tuple[tuple[str, int], ...] = (
+    ("hourly_volume", 3),
+    ("daily_volume", 3),
+    ("weekly_volume", 3),
+    ("monthly_volume", 3),
+    ("yearly_volume", 3),
+    ("lifetime_volume", 3),
+    ("daily_cost", 2),
+    ("weekly_cost", 2),
+    ("monthly_cost", 2),
+    ("yearly_cost", 2),
+    ("lifetime_cost", 2),
+    ("avg_flow_1h", _AVG_FLOW_PRECISION),
+    ("peak_flow_24h", 3),
+    ("peak_flow_7d", 3),
+    ("min_flow_24h", 3),
+    ("avg_hourly_24h", 3),
+    ("peak_hourly_24h", 3),
+    ("peak_hourly_7d", 3),
+    ("avg_daily_7d", 3),
+    ("avg_daily_30d", 3),
+    ("peak_daily_30d", 3),
+)
+
+# Persisted buffers are stored as parallel columns
+_SAMPLE_COLUMNS = ("ts", "value")
+_FLOW_STATS_COLUMNS = ("ts", "max", "min")
+_BUFFER_COLUMNS = {
+    "flow_samples": _SAMPLE_COLUMNS,
+    "hourly_consumption": _SAMPLE_COLUMNS,
+    "daily_consumption": _SAMPLE_COLUMNS,
+    "hourly_flow_stats": _FLOW_STATS_COLUMNS,
+}
+
+
+def _to_storage(
+    rows: Iterable[tuple[float, ...]], names: tuple[str, ...], offset: float
+) -> dict[str, str]:
+    """Return packed buffer columns with loop clock timestamps shifted to epoch."""
+    columns = to_columns(rows, names)
+    columns["ts"] = tuple([ts + offset for ts in columns["ts"]])
+    return {name: pack_floats(column) for name, column in columns.items()}
+
+
+def _from_storage(
+    packed: dict[str, str], names: tuple[str, ...], offset: float
+) -> Iterator[tuple[float, ...]]:
+    """Yield buffer rows from packed columns with epoch timestamps on the loop clock."""
+    columns = {name: unpack_floats(column) for name, column in packed.items()}
+    if "ts" in columns:
+        columns["ts"] = array("d", [ts - offset for ts in columns["ts"]])
+    return from_columns(columns, names)
+
+
+class _DropletStore(Store[dict[str, Any]]):
+    """Store for coordinator data with migration of older layouts."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate persisted data to the current layout."""
+        if old_minor_version < 2:
+            # Buffers were lists of rows
+            for key, names in _BUFFER_COLUMNS.items():
+                columns = to_columns(map(tuple, old_data.get(key, [])), names)
+                old_data[key] = {name: pack_floats(column) for name, column in columns.items()}
+        return old_data
 
 
 class DropletCoordinator(DataUpdateCoordinator[None]):
@@ -88,16 +185,32 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             logger=_LOGGER,
         )
 
-        self._store: Store[dict[str, Any]] = Store(
+        # Shared by all entities; the named device is created in
+        # async_connect and its metadata is registered in _async_setup
+        self.device_identifiers: set[tuple[str, str]] = {(DOMAIN, self.unique_id)}
+        self.device_info = DeviceInfo(identifiers=self.device_identifiers)
+
+        self._store = _DropletStore(
             hass,
             STORAGE_VERSION,
             f"{STORAGE_KEY}_{config_entry.entry_id}",
+            minor_version=STORAGE_MINOR_VERSION,
         )
 
+        # Option values (refreshed by async_apply_options)
+        self._water_tariff: float = DEFAULT_WATER_TARIFF
+        self._water_leak_threshold: float = DEFAULT_WATER_LEAK_THRESHOLD
+        self._cost_per_liter: float = 0.0
+        self._load_options()
+
+        # Device availability (refreshed each WebSocket callback)
+        self.available: bool = self._droplet.get_availability()
+
         # Current values (updated each WebSocket callback)
         self._flow_rate: float = 0.0
         self._volume_delta: float = 0.0
         self._volume_last_reset: datetime = dt_util.now()
+        self._status: tuple[str | None, str | None] = (None, None)
 
         # Period baselines (liters) — persisted values; live totals combine
         # these with pydroplet accumulator readings
@@ -108,6 +221,14 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         self._baseline_monthly: float = 0.0
         self._baseline_yearly: float = 0.0
 
+        # pydroplet accumulator readings (liters), refreshed when volume arrives
+        self._vol_lifetime: float = 0.0
+        self._vol_hourly: float = 0.0
+        self._vol_daily: float = 0.0
+        self._vol_weekly: float = 0.0
+        self._vol_monthly: float = 0.0
+        self._vol_yearly: float = 0.0
+
         # Period reset timestamps
         now = dt_util.now()
         self._hourly_reset: datetime = now
@@ -116,23 +237,70 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         self._monthly_reset: datetime = now
         self._yearly_reset: datetime = now
 
+        # Next period boundaries as timestamps, so each update compares floats,
+        # and the resets as stored, so saves do not reformat them
+        self._next_hour_ts: float
+        self._next_day_ts: float
+        self._next_week_ts: float
+        self._next_month_ts: float
+        self._next_year_ts: float
+        self._next_boundary_ts: float  # earliest of the five
+        self._hourly_reset_iso: str
+        self._daily_reset_iso: str
+        self._weekly_reset_iso: str
+        self._monthly_reset_iso: str
+        self._yearly_reset_iso: str
+        self._update_period_cache()
+
         # Hourly flow tracking (for hourly_flow_stats buffer)
         self._hourly_max_flow: float = 0.0
         self._hourly_min_flow: float | None = None
 
         # Statistics buffers
-        self._flow_samples: list[tuple[float, float]] = []  # (ts, L/min)
-        self._hourly_consumption: list[tuple[float, float]] = []  # (ts, L)
-        self._daily_consumption: list[tuple[float, float]] = []  # (ts, L)
-        self._hourly_flow_stats: list[tuple[float, float, float]] = []  # (ts, max, min)
+        # Windows are also capped to bound memory: the periodic ones at the
+        # entries their period produces, flow at FLOW_SAMPLES_MAX
+        self._flow_samples = RollingWindow(HOUR_SECONDS, FLOW_SAMPLES_MAX)  # (ts, L/min)
+        self._hourly_consumption = RollingWindow(WEEK_SECONDS, HOURS_PER_WEEK)  # (ts, L)
+        self._daily_consumption = RollingWindow(MONTH_SECONDS, DAYS_PER_MONTH)  # (ts, L)
+        self._hourly_flow_stats: deque[tuple[float, float, float]] = deque(
+            maxlen=HOURS_PER_WEEK
+        )  # (ts, max, min)
+
+        # Shorter windows over the same samples, kept alongside the buffers
+        # so every statistic is maintained incrementally
+        self._hourly_consumption_24h = RollingWindow(DAY_SECONDS, HOURS_PER_DAY)
+        self._daily_consumption_7d = RollingWindow(WEEK_SECONDS, DAYS_PER_WEEK)
+        self._peak_flow_24h = RollingWindow(DAY_SECONDS, HOURS_PER_DAY)
+        self._peak_flow_7d = RollingWindow(WEEK_SECONDS, HOURS_PER_WEEK)
+        self._min_flow_24h = RollingWindow(DAY_SECONDS, HOURS_PER_DAY)
 
         # Leak detection
         self._water_leak_detected: bool = False
         self._pending_leak_event: tuple[str, dict[str, float]] | None = None
+        self._leak_issue_update_scheduled: bool = False
+        self.leak_event_signal = f"{DOMAIN}_{self.unique_id}_leak"
+
+        # Set once the device has sent its metadata
+        self._metadata_event = asyncio.Event()
 
-        # Background task handles
+        # Background task handle
         self._listen_task: asyncio.Task[None] | None = None
-        self._save_unsub: CALLBACK_TYPE | None = None
+
+        # True while a delayed save is scheduled
+        self._dirty: bool = False
+
+        # Option writes from number entities, coalesced into one entry update
+        self._pending_options: dict[str, float] = {}
+        self._options_debouncer: Debouncer[None] = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=OPTIONS_WRITE_COOLDOWN,
+            immediate=True,
+            function=self._async_write_options,
+        )
+
+        # Rounded sensor values, refreshed once per listener update
+        self.rounded_values: dict[str, float | None] = {}
 
     # -- Identity --
 
@@ -168,13 +336,6 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         """Return the serial number."""
         return self._droplet.get_sn()
 
-    # -- Availability --
-
-    @property
-    def available(self) -> bool:
-        """Return True if the device is available."""
-        return self._droplet.get_availability()
-
     # -- Current values --
 
     @property
@@ -207,32 +368,32 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
     @property
     def hourly_volume(self) -> float:
         """Return current hour consumption in liters."""
-        return self._baseline_hourly + self._droplet.get_accumulated_volume("hourly") / ML_TO_L
+        return self._baseline_hourly + self._vol_hourly
 
     @property
     def daily_volume(self) -> float:
         """Return current day consumption in liters."""
-        return self._baseline_daily + self._droplet.get_accumulated_volume("daily") / ML_TO_L
+        return self._baseline_daily + self._vol_daily
 
     @property
     def weekly_volume(self) -> float:
         """Return current week consumption in liters."""
-        return self._baseline_weekly + self._droplet.get_accumulated_volume("weekly") / ML_TO_L
+        return self._baseline_weekly + self._vol_weekly
 
     @property
     def monthly_volume(self) -> float:
         """Return current month consumption in liters."""
-        return self._baseline_monthly + self._droplet.get_accumulated_volume("monthly") / ML_TO_L
+        return self._baseline_monthly + self._vol_monthly
 
     @property
     def yearly_volume(self) -> float:
         """Return current year consumption in liters."""
-        return self._baseline_yearly + self._droplet.get_accumulated_volume("yearly") / ML_TO_L
+        return self._baseline_yearly + self._vol_yearly
 
     @property
     def lifetime_volume(self) -> float:
         """Return lifetime consumption in liters."""
-        return self._baseline_lifetime + self._droplet.get_accumulated_volume("lifetime") / ML_TO_L
+        return self._baseline_lifetime + self._vol_lifetime
 
     # -- Period resets --
 
@@ -266,28 +427,63 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
     @property
     def water_tariff(self) -> float:
         """Return the configured water tariff."""
-        return self.config_entry.options.get(CONF_WATER_TARIFF, DEFAULT_WATER_TARIFF)
+        return self._water_tariff
 
     @property
     def water_leak_threshold(self) -> float:
         """Return the configured leak detection threshold."""
-        return self.config_entry.options.get(
-            CONF_WATER_LEAK_THRESHOLD, DEFAULT_WATER_LEAK_THRESHOLD
-        )
+        return self._water_leak_threshold
 
     @property
     def is_metric(self) -> bool:
         """Return True if the HA instance uses metric units."""
         return self.hass.config.units is METRIC_SYSTEM
 
+    def _load_options(self) -> None:
+        """Cache option values and the derived cost per liter."""
+        options = self.config_entry.options
+        self._water_tariff = options.get(CONF_WATER_TARIFF, DEFAULT_WATER_TARIFF)
+        self._water_leak_threshold = options.get(
+            CONF_WATER_LEAK_THRESHOLD, DEFAULT_WATER_LEAK_THRESHOLD
+        )
+        # Tariff is per m³ (metric) or per gallon (imperial)
+        liters_per_unit = L_TO_M3 if self.is_metric else L_TO_GAL
+        self._cost_per_liter = self._water_tariff / liters_per_unit
+
+    @callback
+    def async_apply_options(self) -> None:
+        """Refresh cached option values and push them to entities."""
+        self._load_options()
+        self._evaluate_leak()
+        self.async_update_listeners()
+
+    async def async_set_option(self, key: str, value: float) -> None:
+        """Queue an option change; changes within the cooldown are written once.
+
+        Setting an option to its current value does nothing.
+        """
+        if key not in self._pending_options and self.config_entry.options.get(key) == value:
+            return
+        self._pending_options[key] = value
+        await self._options_debouncer.async_call()
+
+    @callback
+    def _async_write_options(self) -> None:
+        """Merge queued option changes into the config entry."""
+        current = self.config_entry.options
+        changes = {
+            key: value for key, value in self._pending_options.items() if current.get(key) != value
+        }
+        self._pending_options = {}
+        if not changes:
+            return
+        options = dict(current)
+        options.update(changes)
+        self.hass.config_entries.async_update_entry(self.config_entry, options=options)
+
     def _cost_for_volume(self, volume_l: float) -> float:
         """Calculate cost for a volume in liters using the configured tariff."""
-        tariff = self.water_tariff
-        if tariff == 0.0:
-            return 0.0
-        if self.is_metric:
-            return volume_l / L_TO_M3 * tariff
-        return volume_l / L_TO_GAL * tariff
+        return volume_l * self._cost_per_liter
 
     @property
     def daily_cost(self) -> float:
@@ -319,64 +515,52 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
     @property
     def avg_flow_1h(self) -> float | None:
         """Return average flow rate over the last hour."""
-        return compute_average(self._flow_samples, HOUR_SECONDS, time.time())
+        return self._flow_samples.average
 
     @property
     def peak_flow_24h(self) -> float | None:
         """Return peak flow rate over the last 24 hours."""
-        if not self._hourly_flow_stats:
-            return None
-        cutoff = time.time() - DAY_SECONDS
-        valid = [mx for ts, mx, _mn in self._hourly_flow_stats if ts >= cutoff]
-        return max(valid) if valid else None
+        return self._peak_flow_24h.maximum
 
     @property
     def peak_flow_7d(self) -> float | None:
         """Return peak flow rate over the last 7 days."""
-        if not self._hourly_flow_stats:
-            return None
-        cutoff = time.time() - WEEK_SECONDS
-        valid = [mx for ts, mx, _mn in self._hourly_flow_stats if ts >= cutoff]
-        return max(valid) if valid else None
+        return self._peak_flow_7d.maximum
 
     @property
     def min_flow_24h(self) -> float | None:
         """Return minimum flow rate over the last 24 hours."""
-        if not self._hourly_flow_stats:
-            return None
-        cutoff = time.time() - DAY_SECONDS
-        valid = [mn for ts, _mx, mn in self._hourly_flow_stats if ts >= cutoff]
-        return min(valid) if valid else None
+        return self._min_flow_24h.minimum
 
     @property
     def avg_hourly_24h(self) -> float | None:
         """Return average hourly consumption over the last 24 hours."""
-        return compute_average(self._hourly_consumption, DAY_SECONDS, time.time())
+        return self._hourly_consumption_24h.average
 
     @property
     def peak_hourly_24h(self) -> float | None:
         """Return peak hourly consumption over the last 24 hours."""
-        return compute_max(self._hourly_consumption, DAY_SECONDS, time.time())
+        return self._hourly_consumption_24h.maximum
 
     @property
     def peak_hourly_7d(self) -> float | None:
         """Return peak hourly consumption over the last 7 days."""
-        return compute_max(self._hourly_consumption, WEEK_SECONDS, time.time())
+        return self._hourly_consumption.maximum
 
     @property
     def avg_daily_7d(self) -> float | None:
         """Return average daily consumption over the last 7 days."""
-        return compute_average(self._daily_consumption, WEEK_SECONDS, time.time())
+        return self._daily_consumption_7d.average
 
     @property
     def avg_daily_30d(self) -> float | None:
         """Return average daily consumption over the last 30 days."""
-        return compute_average(self._daily_consumption, DAY_SECONDS * 30, time.time())
+        return self._daily_consumption.average
 
     @property
     def peak_daily_30d(self) -> float | None:
         """Return peak daily consumption over the last 30 days."""
-        return compute_max(self._daily_consumption, DAY_SECONDS * 30, time.time())
+        return self._daily_consumption.maximum
 
     # -- Buffer counts (for diagnostics) --
 
@@ -419,11 +603,23 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
 
     # -- Setup / Teardown --
 
-    async def async_setup(self) -> None:
-        """Set up the coordinator: load data, start WebSocket, start save timer."""
+    async def async_connect(self) -> None:
+        """Register the device, load persisted data and start the WebSocket listener."""
+        # Entities may register before metadata arrives; the device must
+        # already carry its name so entity_ids get the device-name prefix
+        dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=self.config_entry.entry_id,
+            identifiers=self.device_identifiers,
+            name=self.config_entry.title,
+        )
         await self._async_load_data()
-        self._handle_stale_boundaries()
-        self._register_accumulators()
+        self._update_period_cache()
+        now = dt_util.now()
+        self._handle_stale_boundaries(now)
+        self._trim_buffers(self.hass.loop.time())
+        self._evaluate_leak()
+        self._register_accumulators(now)
+        self._update_rounded_values()
 
         self._listen_task = self.config_entry.async_create_background_task(
             self.hass,
@@ -431,30 +627,34 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
             f"{DOMAIN}_listen_{self.config_entry.entry_id}",
         )
 
-        # Wait for device metadata
-        for _ in range(FW_VERSION_TIMEOUT * 10):
-            if self._droplet.version_info_available():
-                break
-            await asyncio.sleep(0.1)
+    async def _async_setup(self) -> None:
+        """Wait for device metadata and register it (runs on first refresh)."""
+        if self._droplet.version_info_available():
+            self._metadata_event.set()
 
-        if not self._droplet.version_info_available():
+        try:
+            async with asyncio.timeout(FW_VERSION_TIMEOUT):
+                await self._metadata_event.wait()
+        except TimeoutError:
             _LOGGER.warning(
                 "Timeout waiting for device metadata from %s",
                 self.config_entry.data[CONF_HOST],
             )
 
-        # Periodic save
-        self._save_unsub = async_track_time_interval(
-            self.hass,
-            self._async_save_periodic,
-            timedelta(seconds=SAVE_INTERVAL),
+        dr.async_get(self.hass).async_get_or_create(
+            config_entry_id=self.config_entry.entry_id,
+            identifiers=self.device_identifiers,
+            manufacturer=self.device_manufacturer,
+            model=self.device_model,
+            name=self.config_entry.title,
+            sw_version=self.device_firmware,
+            serial_number=self.device_serial,
         )
 
     async def async_shutdown(self) -> None:
-        """Shut down the coordinator: stop listener, save data."""
-        if self._save_unsub:
-            self._save_unsub()
-            self._save_unsub = None
+        """Shut down the coordinator: flush options, stop listener, save data."""
+        self._options_debouncer.async_shutdown()
+        self._async_write_options()
 
         if self._listen_task and not self._listen_task.done():
             await self._droplet.stop_listening()
@@ -469,147 +669,324 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
     async def _async_update_data(self) -> None:
         """Not used — push-based integration."""
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Refresh the rounded sensor values, then notify listeners."""
+        self._update_rounded_values()
+        super().async_update_listeners()
+
+    def _update_rounded_values(self) -> None:
+        """Round every published value once for all entities to read."""
+        rounded: dict[str, float | None] = {}
+        for attr, precision in _ROUNDED_VALUES:
+            value = getattr(self, attr)
+            rounded[attr] = None if value is None else round(value, precision)
+        self.rounded_values = rounded
+
     # -- WebSocket callback --
 
     @callback
     def _on_update(self, _data: Any) -> None:
         """Handle WebSocket update (called from event loop by pydroplet)."""
-        if not self._droplet.get_availability():
-            self.async_set_updated_data(None)
+        was_available = self.available
+        self.available = self._droplet.get_availability()
+        if not self.available:
+            # pydroplet calls back on every reconnect attempt
+            if was_available:
+                self.async_set_updated_data(None)
             return
 
+        if not self._metadata_event.is_set() and self._droplet.version_info_available():
+            self._metadata_event.set()
+
         now = dt_util.now()
         now_ts = now.timestamp()
 
         # Capture volume delta for the delta sensor (resets on read!).
         # Volume accumulation is handled by pydroplet accumulators.
-        self._volume_delta = self._droplet.get_volume_delta()
+        volume_delta = self._droplet.get_volume_delta()
+        flow_rate = self._droplet.get_flow_rate()
+        status = (self._droplet.get_server_status(), self._droplet.get_signal_quality())
+
+        # pydroplet only advances its accumulators when volume arrives
+        if volume_delta:
+            self._refresh_volumes()
+
+        # Keepalive frames (no flow change, no volume) leave every entity
+        # state as it was
+        changed = (
+            not was_available
+            or flow_rate != self._flow_rate
+            or volume_delta != 0.0
+            or self._volume_delta != 0.0
+            or status != self._status
+        )
 
         # Store current values
-        self._flow_rate = self._droplet.get_flow_rate()
+        self._volume_delta = volume_delta
+        self._flow_rate = flow_rate
+        self._status = status
         self._volume_last_reset = now
 
         # Track hourly flow stats
         if self._hourly_min_flow is None:
-            self._hourly_min_flow = self._flow_rate
+            self._hourly_min_flow = flow_rate
         else:
-            self._hourly_min_flow = min(self._hourly_min_flow, self._flow_rate)
-        self._hourly_max_flow = max(self._hourly_max_flow, self._flow_rate)
+            self._hourly_min_flow = min(self._hourly_min_flow, flow_rate)
+        self._hourly_max_flow = max(self._hourly_max_flow, flow_rate)
 
         # Check period boundaries
-        self._check_period_boundaries(now)
+        crossed = self._check_period_boundaries(now, now_ts)
+        if crossed:
+            changed = True
+
+        # Record every frame so the 1h average weighs idle and usage alike
+        loop_ts = self.hass.loop.time()
+        self._flow_samples.append(loop_ts, flow_rate)
+        self._trim_buffers(loop_ts)
+
+        if not changed:
+            # Idle frames still pull the 1h average down; publish it once
+            # the rounded value moves
+            average = self._flow_samples.average
+            if (
+                average is not None
+                and round(average, _AVG_FLOW_PRECISION) != self.rounded_values["avg_flow_1h"]
+            ):
+                self.async_set_updated_data(None)
+            return
 
-        # Record flow sample
-        self._flow_samples.append((now_ts, self._flow_rate))
+        # The 24h minimum flow only moves when an hour is finalized
+        if crossed & BOUNDARY_HOUR:
+            self._evaluate_leak()
 
-        # Trim expired buffer entries
-        self._trim_buffers(now_ts)
-
-        # Evaluate leak detection
-        self._evaluate_leak()
+        self._async_schedule_save()
 
         # Notify entities
         self.async_set_updated_data(None)
 
-    def _check_period_boundaries(self, now: datetime) -> None:
-        """Check and handle period boundary crossings."""
-        if is_new_hour(self._hourly_reset, now):
+    def _refresh_volumes(self) -> None:
+        """Read the pydroplet accumulators once for all volume properties."""
+        get = self._droplet.get_accumulated_volume
+        self._vol_lifetime = get("lifetime") * _INV_ML_TO_L
+        self._vol_hourly = get("hourly") * _INV_ML_TO_L
+        self._vol_daily = get("daily") * _INV_ML_TO_L
+        self._vol_weekly = get("weekly") * _INV_ML_TO_L
+        self._vol_monthly = get("monthly") * _INV_ML_TO_L
+        self._vol_yearly = get("yearly") * _INV_ML_TO_L
+
+    def _check_period_boundaries(self, now: datetime, now_ts: float) -> int:
+        """Check and handle period boundary crossings.
+
+        Returns the crossed_boundaries bitmask of the periods that were reset.
+        """
+        if now_ts < self._next_boundary_ts:
+            return 0
+
+        bits = crossed_boundaries(now_ts, self._boundary_timestamps())
+
+        if bits & BOUNDARY_HOUR:
             # Finalize: baseline + pydroplet accumulated volume
             finalized = self.hourly_volume
-            self._hourly_consumption.append((self._hourly_reset.timestamp(), finalized))
+            hour_ts = self._to_loop_time(self._hourly_reset.timestamp())
+            self._record_hourly_consumption(hour_ts, finalized)
             if self._hourly_min_flow is not None:
-                self._hourly_flow_stats.append(
-                    (
-                        self._hourly_reset.timestamp(),
-                        self._hourly_max_flow,
-                        self._hourly_min_flow,
-                    )
+                self._record_hourly_flow_stats(
+                    hour_ts, self._hourly_max_flow, self._hourly_min_flow
                 )
             # Reset accumulator and baseline
-            self._droplet.reset_accumulator("hourly", next_hour(now))
+            next_reset = next_hour(now)
+            self._droplet.reset_accumulator("hourly", next_reset)
+            self._vol_hourly = 0.0
+            self._next_hour_ts = next_reset.timestamp()
+            self._hourly_reset_iso = now.isoformat()
             self._baseline_hourly = 0.0
             self._hourly_reset = now
             self._hourly_max_flow = 0.0
             self._hourly_min_flow = None
 
-        if is_new_day(self._daily_reset, now):
+        if bits & BOUNDARY_DAY:
             finalized = self.daily_volume
-            self._daily_consumption.append((self._daily_reset.timestamp(), finalized))
-            self._droplet.reset_accumulator("daily", next_day(now))
+            self._record_daily_consumption(
+                self._to_loop_time(self._daily_reset.timestamp()), finalized
+            )
+            next_reset = next_day(now)
+            self._droplet.reset_accumulator("daily", next_reset)
+            self._vol_daily = 0.0
+            self._next_day_ts = next_reset.timestamp()
+            self._daily_reset_iso = now.isoformat()
             self._baseline_daily = 0.0
             self._daily_reset = now
 
-        if is_new_week(self._weekly_reset, now):
-            self._droplet.reset_accumulator("weekly", next_week(now))
+        if bits & BOUNDARY_WEEK:
+            next_reset = next_week(now)
+            self._droplet.reset_accumulator("weekly", next_reset)
+            self._vol_weekly = 0.0
+            self._next_week_ts = next_reset.timestamp()
+            self._weekly_reset_iso = now.isoformat()
             self._baseline_weekly = 0.0
             self._weekly_reset = now
 
-        if is_new_month(self._monthly_reset, now):
-            self._droplet.reset_accumulator("monthly", next_month(now))
+        if bits & BOUNDARY_MONTH:
+            next_reset = next_month(now)
+            self._droplet.reset_accumulator("monthly", next_reset)
+            self._vol_monthly = 0.0
+            self._next_month_ts = next_reset.timestamp()
+            self._monthly_reset_iso = now.isoformat()
             self._baseline_monthly = 0.0
             self._monthly_reset = now
 
-        if is_new_year(self._yearly_reset, now):
-            self._droplet.reset_accumulator("yearly", next_year(now))
+        if bits & BOUNDARY_YEAR:
+            next_reset = next_year(now)
+            self._droplet.reset_accumulator("yearly", next_reset)
+            self._vol_yearly = 0.0
+            self._next_year_ts = next_reset.timestamp()
+            self._yearly_reset_iso = now.isoformat()
             self._baseline_yearly = 0.0
             self._yearly_reset = now
 
-    def _handle_stale_boundaries(self) -> None:
+        self._next_boundary_ts = min(self._boundary_timestamps())
+        return bits
+
+    def _handle_stale_boundaries(self, now: datetime) -> None:
         """Handle period boundaries that were crossed during restart."""
-        now = dt_util.now()
+        now_ts = now.timestamp()
+        now_iso = now.isoformat()
+        bits = crossed_boundaries(now_ts, self._boundary_timestamps())
 
-        if is_new_hour(self._hourly_reset, now):
-            self._hourly_consumption.append((self._hourly_reset.timestamp(), self._baseline_hourly))
+        if bits & BOUNDARY_HOUR:
+            self._record_hourly_consumption(
+                self._to_loop_time(self._hourly_reset.timestamp()), self._baseline_hourly
+            )
+            self._next_hour_ts = next_hour(now).timestamp()
+            self._hourly_reset_iso = now_iso
             self._baseline_hourly = 0.0
             self._hourly_reset = now
             self._hourly_max_flow = 0.0
             self._hourly_min_flow = None
 
-        if is_new_day(self._daily_reset, now):
-            self._daily_consumption.append((self._daily_reset.timestamp(), self._baseline_daily))
+        if bits & BOUNDARY_DAY:
+            self._record_daily_consumption(
+                self._to_loop_time(self._daily_reset.timestamp()), self._baseline_daily
+            )
+            self._next_day_ts = next_day(now).timestamp()
+            self._daily_reset_iso = now_iso
             self._baseline_daily = 0.0
             self._daily_reset = now
 
-        if is_new_week(self._weekly_reset, now):
+        if bits & BOUNDARY_WEEK:
+            self._next_week_ts = next_week(now).timestamp()
+            self._weekly_reset_iso = now_iso
             self._baseline_weekly = 0.0
             self._weekly_reset = now
 
-        if is_new_month(self._monthly_reset, now):
+        if bits & BOUNDARY_MONTH:
+            self._next_month_ts = next_month(now).timestamp()
+            self._monthly_reset_iso = now_iso
             self._baseline_monthly = 0.0
             self._monthly_reset = now
 
-        if is_new_year(self._yearly_reset, now):
+        if bits & BOUNDARY_YEAR:
+            self._next_year_ts = next_year(now).timestamp()
+            self._yearly_reset_iso = now_iso
             self._baseline_yearly = 0.0
             self._yearly_reset = now
 
-    def _register_accumulators(self) -> None:
-        """Register pydroplet accumulators for all period volumes."""
-        now = dt_util.now()
-        self._droplet.add_accumulator("hourly", next_hour(now))
-        self._droplet.add_accumulator("daily", next_day(now))
-        self._droplet.add_accumulator("weekly", next_week(now))
-        self._droplet.add_accumulator("monthly", next_month(now))
-        self._droplet.add_accumulator("yearly", next_year(now))
+        self._next_boundary_ts = min(self._boundary_timestamps())
+
+    def _update_period_cache(self) -> None:
+        """Recompute next boundary timestamps and ISO strings from the resets."""
+        self._next_hour_ts = next_hour(self._hourly_reset).timestamp()
+        self._next_day_ts = next_day(self._daily_reset).timestamp()
+        self._next_week_ts = next_week(self._weekly_reset).timestamp()
+        self._next_month_ts = next_month(self._monthly_reset).timestamp()
+        self._next_year_ts = next_year(self._yearly_reset).timestamp()
+        self._next_boundary_ts = min(self._boundary_timestamps())
+        self._hourly_reset_iso = self._hourly_reset.isoformat()
+        self._daily_reset_iso = self._daily_reset.isoformat()
+        self._weekly_reset_iso = self._weekly_reset.isoformat()
+        self._monthly_reset_iso = self._monthly_reset.isoformat()
+        self._yearly_reset_iso = self._yearly_reset.isoformat()
+
+    def _boundary_timestamps(self) -> tuple[float, float, float, float, float]:
+        """Return the next hour, day, week, month and year boundaries."""
+        return (
+            self._next_hour_ts,
+            self._next_day_ts,
+            self._next_week_ts,
+            self._next_month_ts,
+            self._next_year_ts,
+        )
+
+    def _register_accumulators(self, now: datetime) -> None:
+        """Register pydroplet accumulators for all period volumes.
+
+        The boundary caches are set from the same datetimes, so they always
+        match the accumulators' reset times.
+        """
+        hour, day, week, month, year = (
+            next_hour(now),
+            next_day(now),
+            next_week(now),
+            next_month(now),
+            next_year(now),
+        )
+        self._droplet.add_accumulator("hourly", hour)
+        self._droplet.add_accumulator("daily", day)
+        self._droplet.add_accumulator("weekly", week)
+        self._droplet.add_accumulator("monthly", month)
+        self._droplet.add_accumulator("yearly", year)
         self._droplet.add_accumulator("lifetime", datetime(9999, 12, 31, tzinfo=now.tzinfo))
+        self._next_hour_ts = hour.timestamp()
+        self._next_day_ts = day.timestamp()
+        self._next_week_ts = week.timestamp()
+        self._next_month_ts = month.timestamp()
+        self._next_year_ts = year.timestamp()
+        self._next_boundary_ts = min(self._boundary_timestamps())
+
+    def _clock_offset(self) -> float:
+        """Return the offset of the wall clock from the event loop clock.
+
+        Buffer timestamps use the monotonic loop clock so wall-clock jumps
+        cannot reorder or expire samples; persisted timestamps are epoch.
+        """
+        return time.time() - self.hass.loop.time()
+
+    def _to_loop_time(self, wall_ts: float) -> float:
+        """Convert a wall-clock timestamp to the event loop clock."""
+        return wall_ts - self._clock_offset()
+
+    def _record_hourly_consumption(self, ts: float, volume: float) -> None:
+        """Record a finalized hour of consumption."""
+        self._hourly_consumption.append(ts, volume)
+        self._hourly_consumption_24h.append(ts, volume)
+
+    def _record_daily_consumption(self, ts: float, volume: float) -> None:
+        """Record a finalized day of consumption."""
+        self._daily_consumption.append(ts, volume)
+        self._daily_consumption_7d.append(ts, volume)
+
+    def _record_hourly_flow_stats(self, ts: float, max_flow: float, min_flow: float) -> None:
+        """Record the peak and minimum flow rate of a finalized hour."""
+        self._hourly_flow_stats.append((ts, max_flow, min_flow))
+        self._peak_flow_24h.append(ts, max_flow)
+        self._peak_flow_7d.append(ts, max_flow)
+        self._min_flow_24h.append(ts, min_flow)
 
     def _trim_buffers(self, now_ts: float) -> None:
-        """Trim expired entries from statistics buffers."""
-        # Flow samples: keep 1h
-        cutoff_1h = now_ts - HOUR_SECONDS
-        self._flow_samples = [(ts, v) for ts, v in self._flow_samples if ts >= cutoff_1h]
-
-        # Hourly consumption + flow stats: keep 7d
-        cutoff_7d = now_ts - WEEK_SECONDS
-        self._hourly_consumption = [
-            (ts, v) for ts, v in self._hourly_consumption if ts >= cutoff_7d
-        ]
-        self._hourly_flow_stats = [
-            (ts, mx, mn) for ts, mx, mn in self._hourly_flow_stats if ts >= cutoff_7d
-        ]
-
-        # Daily consumption: keep 30d
-        cutoff_30d = now_ts - DAY_SECONDS * 30
-        self._daily_consumption = [(ts, v) for ts, v in self._daily_consumption if ts >= cutoff_30d]
+        """Expire old entries from statistics buffers and windows.
+
+        now_ts is an event loop clock timestamp.
+        """
+        self._flow_samples.expire(now_ts)
+        self._hourly_consumption.expire(now_ts)
+        self._hourly_consumption_24h.expire(now_ts)
+        self._daily_consumption.expire(now_ts)
+        self._daily_consumption_7d.expire(now_ts)
+        trim_expired(self._hourly_flow_stats, now_ts - WEEK_SECONDS)
+        self._peak_flow_24h.expire(now_ts)
+        self._peak_flow_7d.expire(now_ts)
+        self._min_flow_24h.expire(now_ts)
 
     def _evaluate_leak(self) -> None:
         """Evaluate leak detection based on min_flow_24h vs threshold."""
@@ -632,14 +1009,8 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
                 min_flow,
                 threshold,
             )
-            async_create_issue(
-                self.hass,
-                DOMAIN,
-                EVENT_WATER_LEAK_DETECTED,
-                is_fixable=False,
-                severity=IssueSeverity.WARNING,
-                translation_key=EVENT_WATER_LEAK_DETECTED,
-            )
+            self._async_schedule_leak_issue_update()
+            async_dispatcher_send(self.hass, self.leak_event_signal)
 
         elif min_flow <= threshold and was_leaking:
             self._water_leak_detected = False
@@ -648,37 +1019,77 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
                 {"min_flow": min_flow, "threshold": threshold},
             )
             _LOGGER.info("Water leak cleared: min flow %.3f L/min", min_flow)
+            self._async_schedule_leak_issue_update()
+            async_dispatcher_send(self.hass, self.leak_event_signal)
+
+    @callback
+    def _async_schedule_leak_issue_update(self) -> None:
+        """Sync the leak repair issue after the current update has been handled."""
+        if not self._leak_issue_update_scheduled:
+            self._leak_issue_update_scheduled = True
+            self.hass.loop.call_soon(self._async_update_leak_issue)
+
+    @callback
+    def _async_update_leak_issue(self) -> None:
+        """Create or delete the leak repair issue to match the current state.
+
+        Runs once for any number of leak transitions scheduled before it.
+        """
+        self._leak_issue_update_scheduled = False
+        if self._water_leak_detected:
+            async_create_issue(
+                self.hass,
+                DOMAIN,
+                EVENT_WATER_LEAK_DETECTED,
+                is_fixable=False,
+                severity=IssueSeverity.WARNING,
+                translation_key=EVENT_WATER_LEAK_DETECTED,
+            )
+        else:
             async_delete_issue(self.hass, DOMAIN, EVENT_WATER_LEAK_DETECTED)
 
     # -- Persistence --
 
-    async def _async_save_periodic(self, _now: datetime) -> None:
-        """Periodic save callback."""
-        await self._async_save_data()
+    @callback
+    def _async_schedule_save(self) -> None:
+        """Schedule a delayed save unless one is already pending.
 
-    async def _async_save_data(self) -> None:
-        """Save persistent data to store."""
-        data = {
+        Store.async_delay_save pushes a pending write back on every call, so
+        it is only called once per dirty period to bound the save latency.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self._store.async_delay_save(self._data_to_save, SAVE_INTERVAL)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return persistent data (called by the store when writing)."""
+        self._dirty = False
+        offset = self._clock_offset()
+        return {
             "lifetime_volume": self.lifetime_volume,
             "hourly_volume": self.hourly_volume,
-            "hourly_reset": self._hourly_reset.isoformat(),
+            "hourly_reset": self._hourly_reset_iso,
             "daily_volume": self.daily_volume,
-            "daily_reset": self._daily_reset.isoformat(),
+            "daily_reset": self._daily_reset_iso,
             "weekly_volume": self.weekly_volume,
-            "weekly_reset": self._weekly_reset.isoformat(),
+            "weekly_reset": self._weekly_reset_iso,
             "monthly_volume": self.monthly_volume,
-            "monthly_reset": self._monthly_reset.isoformat(),
+            "monthly_reset": self._monthly_reset_iso,
             "yearly_volume": self.yearly_volume,
-            "yearly_reset": self._yearly_reset.isoformat(),
+            "yearly_reset": self._yearly_reset_iso,
             "hourly_max_flow": self._hourly_max_flow,
             "hourly_min_flow": self._hourly_min_flow,
-            "flow_samples": [[ts, v] for ts, v in self._flow_samples],
-            "hourly_consumption": [[ts, v] for ts, v in self._hourly_consumption],
-            "daily_consumption": [[ts, v] for ts, v in self._daily_consumption],
-            "hourly_flow_stats": [[ts, mx, mn] for ts, mx, mn in self._hourly_flow_stats],
+            "flow_samples": _to_storage(self._flow_samples, _SAMPLE_COLUMNS, offset),
+            "hourly_consumption": _to_storage(self._hourly_consumption, _SAMPLE_COLUMNS, offset),
+            "daily_consumption": _to_storage(self._daily_consumption, _SAMPLE_COLUMNS, offset),
+            "hourly_flow_stats": _to_storage(self._hourly_flow_stats, _FLOW_STATS_COLUMNS, offset),
             "water_leak_detected": self._water_leak_detected,
         }
-        await self._store.async_save(data)
+
+    async def _async_save_data(self) -> None:
+        """Save persistent data to store."""
+        await self._store.async_save(self._data_to_save())
 
     async def _async_load_data(self) -> None:
         """Load persistent data from store."""
@@ -703,10 +1114,19 @@ class DropletCoordinator(DataUpdateCoordinator[None]):
         self._hourly_max_flow = data.get("hourly_max_flow", 0.0)
         self._hourly_min_flow = data.get("hourly_min_flow")
 
-        self._flow_samples = [(s[0], s[1]) for s in data.get("flow_samples", [])]
-        self._hourly_consumption = [(s[0], s[1]) for s in data.get("hourly_consumption", [])]
-        self._daily_consumption = [(s[0], s[1]) for s in data.get("daily_consumption", [])]
-        self._hourly_flow_stats = [(s[0], s[1], s[2]) for s in data.get("hourly_flow_stats", [])]
+        offset = self._clock_offset()
+        for ts, flow in _from_storage(data.get("flow_samples", {}), _SAMPLE_COLUMNS, offset):
+            self._flow_samples.append(ts, flow)
+        for ts, volume in _from_storage(
+            data.get("hourly_consumption", {}), _SAMPLE_COLUMNS, offset
+        ):
+            self._record_hourly_consumption(ts, volume)
+        for ts, volume in _from_storage(data.get("daily_consumption", {}), _SAMPLE_COLUMNS, offset):
+            self._record_daily_consumption(ts, volume)
+        for ts, max_flow, min_flow in _from_storage(
+            data.get("hourly_flow_stats", {}), _FLOW_STATS_COLUMNS, offset
+        ):
+            self._record_hourly_flow_stats(ts, max_flow, min_flow)
 
         self._water_leak_detected = data.get("water_leak_detected", False)
 
@@ -6,12 +6,12 @@ from typing import ClassVar
 
 from homeassistant.components.event import EventEntity
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DropletConfigEntry
-from .const import DOMAIN, EVENT_WATER_LEAK_CLEARED, EVENT_WATER_LEAK_DETECTED, KEY_WATER_LEAK
+from .const import EVENT_WATER_LEAK_CLEARED, EVENT_WATER_LEAK_DETECTED, KEY_WATER_LEAK
 from .coordinator import DropletCoordinator
 
 PARALLEL_UPDATES = 0
@@ -38,21 +38,45 @@ class DropletLeakEvent(CoordinatorEntity[DropletCoordinator], EventEntity):
         """Initialize the event entity."""
         super().__init__(coordinator)
         self._attr_unique_id = f"{coordinator.unique_id}_{KEY_WATER_LEAK}_event"
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-        )
+        self._attr_device_info = coordinator.device_info
+        self._last_available = coordinator.available
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
         return self.coordinator.available
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to leak transitions signalled by the coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, self.coordinator.leak_event_signal, self._handle_leak
+            )
+        )
+        # A transition found while loading stored data was signalled before
+        # this entity subscribed
+        self._handle_leak()
+
     @callback
     def _handle_coordinator_update(self) -> None:
-        """Handle coordinator update and fire pending leak events."""
+        """Handle coordinator update.
+
+        Leak events arrive through the dispatcher, so only an availability
+        change needs a state write here.
+        """
+        available = self.coordinator.available
+        if available != self._last_available:
+            self._last_available = available
+            self.async_write_ha_state()
+
+    @callback
+    def _handle_leak(self) -> None:
+        """Fire the pending leak event."""
         pending = self.coordinator.pending_leak_event
-        if pending:
-            event_type, event_data = pending
-            self._trigger_event(event_type, event_data)
-            self.coordinator.consume_leak_event()
+        if pending is None:
+            return
+        event_type, event_data = pending
+        self._trigger_event(event_type, event_data)
+        self.coordinator.consume_leak_event()
         self.async_write_ha_state()
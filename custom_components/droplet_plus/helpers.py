@@ -2,7 +2,20 @@
 
 from __future__ import annotations
 
+from array import array
+import base64
+from collections import deque
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from datetime import datetime, timedelta
+import sys
+from typing import Any
+
+# Bits returned by crossed_boundaries, in the order of its next_ts argument
+BOUNDARY_HOUR = 1
+BOUNDARY_DAY = 2
+BOUNDARY_WEEK = 4
+BOUNDARY_MONTH = 8
+BOUNDARY_YEAR = 16
 
 
 def normalize_pairing_code(code: str) -> str:
@@ -10,34 +23,12 @@ def normalize_pairing_code(code: str) -> str:
     return code.upper().replace(" ", "")
 
 
-def is_new_hour(last_reset: datetime, now: datetime) -> bool:
-    """Check if the hour boundary has been crossed."""
-    return (
-        now.year != last_reset.year
-        or now.month != last_reset.month
-        or now.day != last_reset.day
-        or now.hour != last_reset.hour
-    )
-
-
-def is_new_day(last_reset: datetime, now: datetime) -> bool:
-    """Check if the day boundary has been crossed."""
-    return now.year != last_reset.year or now.month != last_reset.month or now.day != last_reset.day
-
+def is_valid_pairing_code(code: str) -> bool:
+    """Check that a normalized pairing code is non-empty.
 
-def is_new_week(last_reset: datetime, now: datetime) -> bool:
-    """Check if the ISO week boundary has been crossed."""
-    return now.isocalendar().week != last_reset.isocalendar().week or now.year != last_reset.year
-
-
-def is_new_month(last_reset: datetime, now: datetime) -> bool:
-    """Check if the month boundary has been crossed."""
-    return now.year != last_reset.year or now.month != last_reset.month
-
-
-def is_new_year(last_reset: datetime, now: datetime) -> bool:
-    """Check if the year boundary has been crossed."""
-    return now.year != last_reset.year
+    The code format is left to the device, which rejects wrong codes itself.
+    """
+    return bool(code)
 
 
 def next_hour(now: datetime) -> datetime:
@@ -70,60 +61,155 @@ def next_year(now: datetime) -> datetime:
     return now.replace(year=now.year + 1, month=1, day=1, hour=0, minute=0, second=0, microsecond=0)
 
 
-def compute_average(
-    samples: list[tuple[float, float]], max_age: float, now_ts: float
-) -> float | None:
-    """Compute average from timestamped samples within max_age window.
+def crossed_boundaries(now_ts: float, next_ts: Sequence[float]) -> int:
+    """Return a bitmask of the periods whose next boundary has been reached.
+
+    next_ts holds the hour, day, week, month and year boundary timestamps;
+    bit i is set when next_ts[i] <= now_ts.
+    """
+    bits = 0
+    for bit, boundary_ts in enumerate(next_ts):
+        if now_ts >= boundary_ts:
+            bits |= 1 << bit
+    return bits
 
-    Args:
-        samples: List of (timestamp, value) tuples.
-        max_age: Maximum age in seconds for samples to include.
-        now_ts: Current timestamp for age calculation.
 
-    Returns:
-        Average value or None if no valid samples.
+def to_columns(
+    rows: Iterable[tuple[float, ...]], names: tuple[str, ...]
+) -> dict[str, tuple[float, ...]]:
+    """Transpose fixed-width rows into named columns for storage.
 
+    Columns stay tuples; the JSON encoder writes them as arrays.
     """
-    cutoff = now_ts - max_age
-    valid = [v for ts, v in samples if ts >= cutoff]
-    if not valid:
-        return None
-    return sum(valid) / len(valid)
+    columns = tuple(zip(*rows, strict=True)) or ((),) * len(names)
+    return dict(zip(names, columns, strict=True))
 
 
-def compute_max(samples: list[tuple[float, float]], max_age: float, now_ts: float) -> float | None:
-    """Compute maximum from timestamped samples within max_age window.
+def from_columns(
+    columns: Mapping[str, Sequence[float]], names: tuple[str, ...]
+) -> Iterator[tuple[float, ...]]:
+    """Yield rows from named storage columns (inverse of to_columns)."""
+    return zip(*(columns.get(name, []) for name in names), strict=False)
 
-    Args:
-        samples: List of (timestamp, value) tuples.
-        max_age: Maximum age in seconds for samples to include.
-        now_ts: Current timestamp for age calculation.
 
-    Returns:
-        Maximum value or None if no valid samples.
+def pack_floats(values: Iterable[float]) -> str:
+    """Pack floats as base64 of little-endian IEEE 754 doubles."""
+    packed = array("d", values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return base64.b64encode(packed.tobytes()).decode("ascii")
 
-    """
-    cutoff = now_ts - max_age
-    valid = [v for ts, v in samples if ts >= cutoff]
-    if not valid:
-        return None
-    return max(valid)
 
+def unpack_floats(data: str) -> array[float]:
+    """Unpack floats packed by pack_floats."""
+    unpacked = array("d")
+    unpacked.frombytes(base64.b64decode(data))
+    if sys.byteorder == "big":
+        unpacked.byteswap()
+    return unpacked
 
-def compute_min(samples: list[tuple[float, float]], max_age: float, now_ts: float) -> float | None:
-    """Compute minimum from timestamped samples within max_age window.
 
-    Args:
-        samples: List of (timestamp, value) tuples.
-        max_age: Maximum age in seconds for samples to include.
-        now_ts: Current timestamp for age calculation.
+def trim_expired(buffer: deque[Any], cutoff: float) -> None:
+    """Drop entries older than cutoff from a timestamp-ordered buffer.
+
+    Entries are (timestamp, ...) tuples appended in timestamp order, so
+    expired ones are always at the left end.
+    """
+    while buffer and buffer[0][0] < cutoff:
+        buffer.popleft()
 
-    Returns:
-        Minimum value or None if no valid samples.
 
+class RollingWindow:
+    """Timestamped samples within a sliding time window.
+
+    Average, maximum and minimum are O(1) reads: a running sum backs the
+    average and monotonic deques of candidate samples back the extremes.
+    Appending and expiring samples is amortized O(1). An optional
+    max_samples bound evicts the oldest sample once the window is full.
     """
-    cutoff = now_ts - max_age
-    valid = [v for ts, v in samples if ts >= cutoff]
-    if not valid:
-        return None
-    return min(valid)
+
+    __slots__ = (
+        "_max_age",
+        "_max_candidates",
+        "_max_samples",
+        "_min_candidates",
+        "_samples",
+        "_sum",
+    )
+
+    def __init__(self, max_age: float, max_samples: int | None = None) -> None:
+        """Initialize an empty window keeping samples up to max_age seconds old."""
+        self._max_age = max_age
+        self._max_samples = max_samples
+        self._samples: deque[tuple[float, float]] = deque()
+        self._max_candidates: deque[tuple[float, float]] = deque()
+        self._min_candidates: deque[tuple[float, float]] = deque()
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self._samples)
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Iterate over (timestamp, value) samples, oldest first."""
+        return iter(self._samples)
+
+    def append(self, ts: float, value: float) -> None:
+        """Add a sample no older than any sample already in the window."""
+        if len(self._samples) == self._max_samples:
+            self._pop_oldest()
+
+        sample = (ts, value)
+        self._samples.append(sample)
+        self._sum += value
+
+        # A new sample supersedes older candidates it dominates
+        max_candidates = self._max_candidates
+        while max_candidates and max_candidates[-1][1] <= value:
+            max_candidates.pop()
+        max_candidates.append(sample)
+
+        min_candidates = self._min_candidates
+        while min_candidates and min_candidates[-1][1] >= value:
+            min_candidates.pop()
+        min_candidates.append(sample)
+
+    def expire(self, now_ts: float) -> None:
+        """Drop samples older than the window relative to now_ts."""
+        cutoff = now_ts - self._max_age
+        samples = self._samples
+        while samples and samples[0][0] < cutoff:
+            self._pop_oldest()
+
+    def _pop_oldest(self) -> None:
+        """Remove the oldest sample and any candidate entry for it."""
+        sample = self._samples.popleft()
+        self._sum -= sample[1]
+        # The newest sample is always a candidate, so neither deque is empty
+        if self._max_candidates[0] is sample:
+            self._max_candidates.popleft()
+        if self._min_candidates[0] is sample:
+            self._min_candidates.popleft()
+        # Discard accumulated rounding error whenever the remaining samples
+        # are all equal (e.g. an idle window of zero readings)
+        if not self._samples:
+            self._sum = 0.0
+        elif self._max_candidates[0][1] == self._min_candidates[0][1]:
+            self._sum = self._max_candidates[0][1] * len(self._samples)
+
+    @property
+    def average(self) -> float | None:
+        """Return the average value, or None if the window is empty."""
+        if not self._samples:
+            return None
+        return self._sum / len(self._samples)
+
+    @property
+    def maximum(self) -> float | None:
+        """Return the maximum value, or None if the window is empty."""
+        return self._max_candidates[0][1] if self._max_candidates else None
+
+    @property
+    def minimum(self) -> float | None:
+        """Return the minimum value, or None if the window is empty."""
+        return self._min_candidates[0][1] if self._min_candidates else None
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import attrgetter
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription, NumberMode
 from homeassistant.const import EntityCategory, UnitOfVolumeFlowRate
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util.unit_system import METRIC_SYSTEM
@@ -19,13 +19,13 @@ from .const import (
     CONF_WATER_TARIFF,
     DEFAULT_WATER_LEAK_THRESHOLD,
     DEFAULT_WATER_TARIFF,
-    DOMAIN,
     KEY_WATER_LEAK_THRESHOLD,
     KEY_WATER_TARIFF,
 )
 from .coordinator import DropletCoordinator
 
-PARALLEL_UPDATES = 0
+# Serialize option writes; reads come from the coordinator
+PARALLEL_UPDATES = 1
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -35,17 +35,37 @@ class DropletNumberEntityDescription(NumberEntityDescription):
     option_key: str
     default_value: float
     value_fn: Callable[[DropletCoordinator], float]
+    unique_id_suffix: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Derive the fixed per-key attributes once, when the description is built."""
+        object.__setattr__(self, "unique_id_suffix", f"_{self.key}")
+        if self.translation_key is None:
+            object.__setattr__(self, "translation_key", self.key)
+
+
+_LEAK_THRESHOLD_DESCRIPTION = DropletNumberEntityDescription(
+    key=KEY_WATER_LEAK_THRESHOLD,
+    entity_category=EntityCategory.CONFIG,
+    native_min_value=0,
+    native_max_value=10,
+    native_step=0.01,
+    mode=NumberMode.BOX,
+    native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
+    option_key=CONF_WATER_LEAK_THRESHOLD,
+    default_value=DEFAULT_WATER_LEAK_THRESHOLD,
+    value_fn=attrgetter("water_leak_threshold"),
+)
 
+# Descriptions keyed by (currency, metric unit system)
+_TARIFF_DESCRIPTIONS: dict[tuple[str, bool], tuple[DropletNumberEntityDescription, ...]] = {}
 
-def _get_tariff_descriptions(
-    hass: HomeAssistant,
-) -> tuple[DropletNumberEntityDescription, ...]:
-    """Build number entity descriptions with locale-aware tariff unit."""
-    if hass.config.units is METRIC_SYSTEM:
-        tariff_unit = f"{hass.config.currency}/m\u00b3"
-    else:
-        tariff_unit = f"{hass.config.currency}/gal"
 
+def _build_tariff_descriptions(
+    currency: str, metric: bool
+) -> tuple[DropletNumberEntityDescription, ...]:
+    """Build number entity descriptions for a currency and unit system."""
+    tariff_unit = f"{currency}/m\u00b3" if metric else f"{currency}/gal"
     return (
         DropletNumberEntityDescription(
             key=KEY_WATER_TARIFF,
@@ -57,23 +77,22 @@ def _get_tariff_descriptions(
             native_unit_of_measurement=tariff_unit,
             option_key=CONF_WATER_TARIFF,
             default_value=DEFAULT_WATER_TARIFF,
-            value_fn=lambda c: c.water_tariff,
-        ),
-        DropletNumberEntityDescription(
-            key=KEY_WATER_LEAK_THRESHOLD,
-            entity_category=EntityCategory.CONFIG,
-            native_min_value=0,
-            native_max_value=10,
-            native_step=0.01,
-            mode=NumberMode.BOX,
-            native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-            option_key=CONF_WATER_LEAK_THRESHOLD,
-            default_value=DEFAULT_WATER_LEAK_THRESHOLD,
-            value_fn=lambda c: c.water_leak_threshold,
+            value_fn=attrgetter("water_tariff"),
         ),
+        _LEAK_THRESHOLD_DESCRIPTION,
     )
 
 
+def _get_tariff_descriptions(
+    hass: HomeAssistant,
+) -> tuple[DropletNumberEntityDescription, ...]:
+    """Return number entity descriptions with locale-aware tariff unit."""
+    key = (hass.config.currency, hass.config.units is METRIC_SYSTEM)
+    if (descriptions := _TARIFF_DESCRIPTIONS.get(key)) is None:
+        descriptions = _TARIFF_DESCRIPTIONS[key] = _build_tariff_descriptions(*key)
+    return descriptions
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: DropletConfigEntry,
@@ -82,7 +101,7 @@ async def async_setup_entry(
     """Set up Droplet number entities."""
     coordinator = entry.runtime_data
     descriptions = _get_tariff_descriptions(hass)
-    async_add_entities(DropletNumber(coordinator, description) for description in descriptions)
+    async_add_entities([DropletNumber(coordinator, description) for description in descriptions])
 
 
 class DropletNumber(CoordinatorEntity[DropletCoordinator], NumberEntity):
@@ -99,11 +118,9 @@ class DropletNumber(CoordinatorEntity[DropletCoordinator], NumberEntity):
         """Initialize the number entity."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
-        self._attr_translation_key = description.key
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-        )
+        self._attr_unique_id = coordinator.unique_id + description.unique_id_suffix
+        self._attr_device_info = coordinator.device_info
+        self._value_fn = description.value_fn
 
     @property
     def available(self) -> bool:
@@ -113,15 +130,13 @@ class DropletNumber(CoordinatorEntity[DropletCoordinator], NumberEntity):
     @property
     def native_value(self) -> float:
         """Return the current value."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self._value_fn(self.coordinator)
 
     async def async_set_native_value(self, value: float) -> None:
-        """Update the value."""
-        self.hass.config_entries.async_update_entry(
-            self.coordinator.config_entry,
-            options={
-                **self.coordinator.config_entry.options,
-                self.entity_description.option_key: value,
-            },
-        )
-        self.async_write_ha_state()
+        """Update the value.
+
+        The coordinator coalesces rapid changes into one entry update; the
+        entry update listener then refreshes it, which writes the new state
+        for this and the dependent cost entities.
+        """
+        await self.coordinator.async_set_option(self.entity_description.option_key, value)
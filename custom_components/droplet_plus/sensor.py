@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import partial
+from operator import attrgetter
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -12,15 +14,18 @@ from homeassistant.components.sensor import (
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.const import EntityCategory, UnitOfVolume, UnitOfVolumeFlowRate
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.const import (
+    EVENT_CORE_CONFIG_UPDATE,
+    EntityCategory,
+    UnitOfVolume,
+    UnitOfVolumeFlowRate,
+)
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import DropletConfigEntry
 from .const import (
-    DOMAIN,
     KEY_SERVER_STATUS,
     KEY_SIGNAL_QUALITY,
     KEY_WATER_AVG_DAILY_7D,
@@ -59,6 +64,22 @@ class DropletSensorEntityDescription(SensorEntityDescription):
     value_fn: Callable[[DropletCoordinator], float | str | None]
     last_reset_fn: Callable[[DropletCoordinator], datetime | None] = lambda _: None
     is_cost: bool = False
+    unique_id_suffix: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Derive the fixed per-key attributes once, at import."""
+        object.__setattr__(self, "unique_id_suffix", f"_{self.key}")
+        if self.translation_key is None:
+            object.__setattr__(self, "translation_key", self.key)
+
+
+def _rounded(attr: str) -> Callable[[DropletCoordinator], float | None]:
+    """Return a value_fn reading a value the coordinator has already rounded."""
+
+    def value_fn(coordinator: DropletCoordinator) -> float | None:
+        return coordinator.rounded_values.get(attr)
+
+    return value_fn
 
 
 SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
@@ -68,7 +89,7 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: c.flow_rate,
+        value_fn=attrgetter("flow_rate"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_VOLUME_DELTA,
@@ -77,18 +98,18 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         native_unit_of_measurement=UnitOfVolume.MILLILITERS,
         entity_category=EntityCategory.DIAGNOSTIC,
         entity_registry_enabled_default=False,
-        value_fn=lambda c: c.volume_delta,
-        last_reset_fn=lambda c: c.volume_last_reset,
+        value_fn=attrgetter("volume_delta"),
+        last_reset_fn=attrgetter("volume_last_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_SERVER_STATUS,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda c: c.server_status,
+        value_fn=attrgetter("server_status"),
     ),
     DropletSensorEntityDescription(
         key=KEY_SIGNAL_QUALITY,
         entity_category=EntityCategory.DIAGNOSTIC,
-        value_fn=lambda c: c.signal_quality,
+        value_fn=attrgetter("signal_quality"),
     ),
     # -- Period consumption sensors --
     DropletSensorEntityDescription(
@@ -96,47 +117,47 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.hourly_volume, 3),
-        last_reset_fn=lambda c: c.hourly_reset,
+        value_fn=_rounded("hourly_volume"),
+        last_reset_fn=attrgetter("hourly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_DAILY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.daily_volume, 3),
-        last_reset_fn=lambda c: c.daily_reset,
+        value_fn=_rounded("daily_volume"),
+        last_reset_fn=attrgetter("daily_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_WEEKLY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.weekly_volume, 3),
-        last_reset_fn=lambda c: c.weekly_reset,
+        value_fn=_rounded("weekly_volume"),
+        last_reset_fn=attrgetter("weekly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_MONTHLY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.monthly_volume, 3),
-        last_reset_fn=lambda c: c.monthly_reset,
+        value_fn=_rounded("monthly_volume"),
+        last_reset_fn=attrgetter("monthly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_YEARLY,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.yearly_volume, 3),
-        last_reset_fn=lambda c: c.yearly_reset,
+        value_fn=_rounded("yearly_volume"),
+        last_reset_fn=attrgetter("yearly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_CONSUMPTION_LIFETIME,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.TOTAL_INCREASING,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: round(c.lifetime_volume, 3),
+        value_fn=_rounded("lifetime_volume"),
     ),
     # -- Cost sensors --
     DropletSensorEntityDescription(
@@ -144,39 +165,39 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.daily_cost, 2),
-        last_reset_fn=lambda c: c.daily_reset,
+        value_fn=_rounded("daily_cost"),
+        last_reset_fn=attrgetter("daily_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_WEEKLY,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.weekly_cost, 2),
-        last_reset_fn=lambda c: c.weekly_reset,
+        value_fn=_rounded("weekly_cost"),
+        last_reset_fn=attrgetter("weekly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_MONTHLY,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.monthly_cost, 2),
-        last_reset_fn=lambda c: c.monthly_reset,
+        value_fn=_rounded("monthly_cost"),
+        last_reset_fn=attrgetter("monthly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_YEARLY,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL,
         is_cost=True,
-        value_fn=lambda c: round(c.yearly_cost, 2),
-        last_reset_fn=lambda c: c.yearly_reset,
+        value_fn=_rounded("yearly_cost"),
+        last_reset_fn=attrgetter("yearly_reset"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_COST_LIFETIME,
         device_class=SensorDeviceClass.MONETARY,
         state_class=SensorStateClass.TOTAL_INCREASING,
         is_cost=True,
-        value_fn=lambda c: round(c.lifetime_cost, 2),
+        value_fn=_rounded("lifetime_cost"),
     ),
     # -- Statistics: flow --
     DropletSensorEntityDescription(
@@ -184,28 +205,28 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.avg_flow_1h, 3),
+        value_fn=_rounded("avg_flow_1h"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_FLOW_24H,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.peak_flow_24h, 3),
+        value_fn=_rounded("peak_flow_24h"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_FLOW_7D,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.peak_flow_7d, 3),
+        value_fn=_rounded("peak_flow_7d"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_MIN_FLOW_24H,
         device_class=SensorDeviceClass.VOLUME_FLOW_RATE,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolumeFlowRate.LITERS_PER_MINUTE,
-        value_fn=lambda c: _round_or_none(c.min_flow_24h, 3),
+        value_fn=_rounded("min_flow_24h"),
     ),
     # -- Statistics: hourly consumption --
     DropletSensorEntityDescription(
@@ -213,21 +234,21 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.avg_hourly_24h, 3),
+        value_fn=_rounded("avg_hourly_24h"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_HOURLY_24H,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.peak_hourly_24h, 3),
+        value_fn=_rounded("peak_hourly_24h"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_HOURLY_7D,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.peak_hourly_7d, 3),
+        value_fn=_rounded("peak_hourly_7d"),
     ),
     # -- Statistics: daily consumption --
     DropletSensorEntityDescription(
@@ -235,32 +256,25 @@ SENSOR_DESCRIPTIONS: tuple[DropletSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.avg_daily_7d, 3),
+        value_fn=_rounded("avg_daily_7d"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_AVG_DAILY_30D,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.avg_daily_30d, 3),
+        value_fn=_rounded("avg_daily_30d"),
     ),
     DropletSensorEntityDescription(
         key=KEY_WATER_PEAK_DAILY_30D,
         device_class=SensorDeviceClass.WATER,
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfVolume.LITERS,
-        value_fn=lambda c: _round_or_none(c.peak_daily_30d, 3),
+        value_fn=_rounded("peak_daily_30d"),
     ),
 )
 
 
-def _round_or_none(value: float | None, precision: int) -> float | None:
-    """Round a value if not None."""
-    if value is None:
-        return None
-    return round(value, precision)
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: DropletConfigEntry,
@@ -268,9 +282,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Droplet sensor entities."""
     coordinator = entry.runtime_data
-    async_add_entities(
-        DropletSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS
-    )
+    async_add_entities([factory(coordinator) for factory in _SENSOR_FACTORIES])
 
 
 class DropletSensor(CoordinatorEntity[DropletCoordinator], SensorEntity):
@@ -287,16 +299,12 @@ class DropletSensor(CoordinatorEntity[DropletCoordinator], SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.entity_description = description
-        self._attr_unique_id = f"{coordinator.unique_id}_{description.key}"
-        self._attr_translation_key = description.key
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.unique_id)},
-            manufacturer=coordinator.device_manufacturer,
-            model=coordinator.device_model,
-            name=coordinator.config_entry.title,
-            sw_version=coordinator.device_firmware,
-            serial_number=coordinator.device_serial,
-        )
+        self._attr_unique_id = coordinator.unique_id + description.unique_id_suffix
+        self._attr_device_info = coordinator.device_info
+        # Bound once; the state properties run on every state write
+        self._value_fn = description.value_fn
+        self._last_reset_fn = description.last_reset_fn
+        self._attr_native_unit_of_measurement = description.native_unit_of_measurement
 
     @property
     def available(self) -> bool:
@@ -306,16 +314,44 @@ class DropletSensor(CoordinatorEntity[DropletCoordinator], SensorEntity):
     @property
     def native_value(self) -> float | str | None:
         """Return the state of the sensor."""
-        return self.entity_description.value_fn(self.coordinator)
+        return self._value_fn(self.coordinator)
 
     @property
     def last_reset(self) -> datetime | None:
         """Return the last reset time."""
-        return self.entity_description.last_reset_fn(self.coordinator)
+        return self._last_reset_fn(self.coordinator)
 
-    @property
-    def native_unit_of_measurement(self) -> str | None:
-        """Return the unit of measurement."""
-        if self.entity_description.is_cost:
-            return self.hass.config.currency
-        return self.entity_description.native_unit_of_measurement
+
+class DropletCostSensor(DropletSensor):
+    """Representation of a Droplet cost sensor, in the configured currency."""
+
+    def __init__(
+        self,
+        coordinator: DropletCoordinator,
+        description: DropletSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, description)
+        self._attr_native_unit_of_measurement = coordinator.hass.config.currency
+
+    async def async_added_to_hass(self) -> None:
+        """Follow currency changes in the core configuration."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.hass.bus.async_listen(EVENT_CORE_CONFIG_UPDATE, self._async_currency_updated)
+        )
+
+    @callback
+    def _async_currency_updated(self, _event: Event) -> None:
+        """Apply a new currency as the unit of measurement."""
+        currency = self.hass.config.currency
+        if currency != self._attr_native_unit_of_measurement:
+            self._attr_native_unit_of_measurement = currency
+            self.async_write_ha_state()
+
+
+# Entity class and description bound once per description, at import
+_SENSOR_FACTORIES: tuple[Callable[[DropletCoordinator], DropletSensor], ...] = tuple(
+    partial(DropletCostSensor if description.is_cost else DropletSensor, description=description)
+    for description in SENSOR_DESCRIPTIONS
+)
@@ -17,6 +17,7 @@ from custom_components.droplet_plus.const import (
 )
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TOKEN
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 TEST_HOST = "192.168.1.100"
 TEST_PORT = 443
@@ -145,3 +146,25 @@ async def mock_setup_entry(
     await hass.config_entries.async_setup(mock_config_entry.entry_id)
     await hass.async_block_till_done()
     return mock_config_entry
+
+
+@pytest.fixture
+def droplet_device(
+    device_registry: dr.DeviceRegistry,
+    mock_setup_entry: MockConfigEntry,
+) -> dr.DeviceEntry | None:
+    """Return the device registered for the mock config entry."""
+    return device_registry.async_get_device(identifiers={(DOMAIN, mock_setup_entry.unique_id)})
+
+
+@pytest.fixture
+def droplet_sensors(
+    entity_registry: er.EntityRegistry,
+    mock_setup_entry: MockConfigEntry,
+) -> dict[str, er.RegistryEntry]:
+    """Return the integration's sensor registry entries keyed by description key."""
+    return {
+        e.translation_key: e
+        for e in er.async_entries_for_config_entry(entity_registry, mock_setup_entry.entry_id)
+        if e.domain == "sensor"
+    }
@@ -10,7 +10,6 @@ from custom_components.droplet_plus.const import DOMAIN
 from homeassistant.components.binary_sensor import BinarySensorDeviceClass
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
-from homeassistant.util import dt as dt_util
 
 
 async def test_binary_sensor_exists(
@@ -49,8 +48,9 @@ async def test_binary_sensor_on_when_leak(
     coordinator = mock_setup_entry.runtime_data
 
     # Simulate leak detection
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
     coordinator._evaluate_leak()
     coordinator.async_set_updated_data(None)
     await hass.async_block_till_done()
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
+from aiohttp import ClientError
+
 from custom_components.droplet_plus.const import (
     CONF_DEVICE_ID,
     CONF_WATER_LEAK_THRESHOLD,
@@ -87,6 +89,77 @@ async def test_user_flow_exception(
     assert result["errors"] == {"base": "cannot_connect"}
 
 
+async def test_user_flow_invalid_token(
+    hass: HomeAssistant,
+    mock_discovery: MagicMock,
+) -> None:
+    """Test user flow rejects a blank pairing code without connecting."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: TEST_HOST, CONF_TOKEN: "   "},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {CONF_TOKEN: "invalid_token"}
+    mock_discovery.try_connect.assert_not_awaited()
+
+
+async def test_user_flow_timeout(
+    hass: HomeAssistant,
+    mock_discovery: MagicMock,
+) -> None:
+    """Test user flow with a connection timeout."""
+    mock_discovery.try_connect = AsyncMock(side_effect=TimeoutError)
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: TEST_HOST, CONF_TOKEN: TEST_TOKEN},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "timeout"}
+
+
+async def test_user_flow_client_error(
+    hass: HomeAssistant,
+    mock_discovery: MagicMock,
+) -> None:
+    """Test user flow with a network error."""
+    mock_discovery.try_connect = AsyncMock(side_effect=ClientError("Boom"))
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: TEST_HOST, CONF_TOKEN: TEST_TOKEN},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
+async def test_user_flow_no_device_id(
+    hass: HomeAssistant,
+    mock_discovery: MagicMock,
+) -> None:
+    """Test user flow reports an error when the device ID cannot be read."""
+    mock_discovery.get_device_id = AsyncMock(return_value="")
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {CONF_HOST: TEST_HOST, CONF_TOKEN: TEST_TOKEN},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["errors"] == {"base": "cannot_connect"}
+
+
 async def test_user_flow_already_configured(
     hass: HomeAssistant,
     mock_discovery: MagicMock,
@@ -115,7 +188,7 @@ async def test_zeroconf_flow(
         ip_address=TEST_HOST,
         ip_addresses=[TEST_HOST],
         hostname="droplet.local.",
-        name="Droplet-1234._droplet._tcp.local.",
+        name=f"{TEST_DEVICE_ID}._droplet._tcp.local.",
         port=TEST_PORT,
         properties={},
         type="_droplet._tcp.local.",
@@ -135,6 +208,7 @@ async def test_zeroconf_flow(
     )
     assert result["type"] is FlowResultType.FORM
     assert result["step_id"] == "options"
+    mock_discovery.get_device_id.assert_not_awaited()
 
     result = await hass.config_entries.flow.async_configure(
         result["flow_id"],
@@ -147,6 +221,61 @@ async def test_zeroconf_flow(
     assert result["options"][CONF_WATER_LEAK_THRESHOLD] == 0.05
 
 
+async def test_zeroconf_flow_already_configured(
+    hass: HomeAssistant,
+    mock_discovery: MagicMock,
+    mock_config_entry,
+) -> None:
+    """Test zeroconf announcement with unchanged host/port aborts early."""
+    mock_config_entry.add_to_hass(hass)
+    discovery_info = ZeroconfServiceInfo(
+        ip_address=TEST_HOST,
+        ip_addresses=[TEST_HOST],
+        hostname="droplet.local.",
+        name=f"{TEST_DEVICE_ID}._droplet._tcp.local.",
+        port=TEST_PORT,
+        properties={},
+        type="_droplet._tcp.local.",
+    )
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_ZEROCONF},
+        data=discovery_info,
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+
+
+async def test_zeroconf_flow_updates_host(
+    hass: HomeAssistant,
+    mock_discovery: MagicMock,
+    mock_config_entry,
+) -> None:
+    """Test zeroconf discovery of a configured device updates its host."""
+    mock_config_entry.add_to_hass(hass)
+    new_host = "192.168.1.200"
+    discovery_info = ZeroconfServiceInfo(
+        ip_address=new_host,
+        ip_addresses=[new_host],
+        hostname="droplet.local.",
+        name=f"{TEST_DEVICE_ID}._droplet._tcp.local.",
+        port=TEST_PORT,
+        properties={},
+        type="_droplet._tcp.local.",
+    )
+
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": config_entries.SOURCE_ZEROCONF},
+        data=discovery_info,
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "already_configured"
+    assert mock_config_entry.data[CONF_HOST] == new_host
+    mock_discovery.try_connect.assert_not_awaited()
+
+
 async def test_options_flow(
     hass: HomeAssistant,
     mock_setup_entry,
@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
-from unittest.mock import MagicMock
+import time
+from typing import Any
+from unittest.mock import MagicMock, patch
 
 import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.droplet_plus.const import EVENT_WATER_LEAK_CLEARED, EVENT_WATER_LEAK_DETECTED
+from custom_components.droplet_plus.const import (
+    EVENT_WATER_LEAK_CLEARED,
+    EVENT_WATER_LEAK_DETECTED,
+    STORAGE_MINOR_VERSION,
+)
+from custom_components.droplet_plus.coordinator import DropletCoordinator, _DropletStore
+from custom_components.droplet_plus.helpers import pack_floats, unpack_floats
 from homeassistant.core import HomeAssistant
 from homeassistant.util import dt as dt_util
 
@@ -50,6 +59,7 @@ async def test_volume_properties_combine_baseline_and_accumulator(
     mock_droplet._accumulated_volumes["hourly"] = 500.0  # 0.5 L
     mock_droplet._accumulated_volumes["daily"] = 1000.0  # 1.0 L
     mock_droplet._accumulated_volumes["lifetime"] = 2000.0  # 2.0 L
+    coordinator._refresh_volumes()
 
     assert coordinator.hourly_volume == pytest.approx(5.5)
     assert coordinator.daily_volume == pytest.approx(101.0)
@@ -67,6 +77,7 @@ async def test_on_update_skips_when_unavailable(
 
     coordinator._on_update(None)
 
+    assert coordinator.available is False
     assert coordinator.lifetime_volume == 0.0
     mock_droplet.get_volume_delta.assert_not_called()
 
@@ -85,6 +96,7 @@ async def test_hourly_boundary_crossing(
 
     # Force hour boundary crossing
     coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
+    coordinator._update_period_cache()
     mock_droplet.get_volume_delta.return_value = 10.0
     coordinator._on_update(None)
 
@@ -93,9 +105,10 @@ async def test_hourly_boundary_crossing(
     mock_droplet.reset_accumulator.assert_any_call(
         "hourly", mock_droplet.reset_accumulator.call_args_list[0][0][1]
     )
+    assert coordinator._hourly_reset_iso == coordinator._hourly_reset.isoformat()
     # Hourly consumption buffer should have the finalized hour
     assert len(coordinator._hourly_consumption) == 1
-    assert coordinator._hourly_consumption[0][1] == pytest.approx(1.0)
+    assert coordinator.peak_hourly_24h == pytest.approx(1.0)
 
 
 async def test_daily_boundary_crossing(
@@ -112,12 +125,30 @@ async def test_daily_boundary_crossing(
     # Force day boundary
     coordinator._daily_reset = dt_util.now() - timedelta(days=2)
     coordinator._hourly_reset = dt_util.now() - timedelta(hours=2)
+    coordinator._update_period_cache()
     mock_droplet.get_volume_delta.return_value = 100.0
     coordinator._on_update(None)
 
     assert coordinator._baseline_daily == 0.0
     assert len(coordinator._daily_consumption) == 1
-    assert coordinator._daily_consumption[0][1] == pytest.approx(5.0)
+    assert coordinator.avg_daily_7d == pytest.approx(5.0)
+
+
+async def test_stale_boundaries_after_restart(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test periods that ended while offline are finalized on startup."""
+    coordinator = mock_setup_entry.runtime_data
+
+    coordinator._baseline_daily = 3.0
+    coordinator._daily_reset = dt_util.now() - timedelta(days=2)
+    coordinator._update_period_cache()
+    coordinator._handle_stale_boundaries(dt_util.now())
+
+    assert coordinator._baseline_daily == 0.0
+    assert coordinator.avg_daily_7d == pytest.approx(3.0)
+    assert coordinator._next_day_ts > dt_util.now().timestamp()
 
 
 async def test_flow_samples_recorded(
@@ -135,9 +166,108 @@ async def test_flow_samples_recorded(
     mock_droplet.get_flow_rate.return_value = 2.5
     coordinator._on_update(None)
 
-    assert len(coordinator._flow_samples) == 2
-    assert coordinator._flow_samples[0][1] == 1.5
-    assert coordinator._flow_samples[1][1] == 2.5
+    assert [flow for _ts, flow in coordinator._flow_samples] == [1.5, 2.5]
+    assert coordinator.avg_flow_1h == pytest.approx(2.0)
+
+
+async def test_flow_window_keeps_hour_of_fast_frames(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test frames faster than 1 Hz do not shorten the 1h flow window."""
+    coordinator = mock_setup_entry.runtime_data
+    now_ts = hass.loop.time()
+
+    # Two frames per second for a full hour; the oldest half carries the peak
+    for i in range(7200):
+        coordinator._flow_samples.append(now_ts - 3599.5 + i * 0.5, 4.0 if i < 3600 else 1.0)
+    coordinator._trim_buffers(now_ts)
+
+    assert coordinator.flow_samples_count == 7200
+    assert coordinator.avg_flow_1h == pytest.approx(2.5)
+
+
+async def test_avg_flow_weighs_idle_and_usage_frames(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test the 1h average flow counts idle keepalive frames like usage frames."""
+    coordinator = mock_setup_entry.runtime_data
+
+    mock_droplet.get_flow_rate.return_value = 0.0
+    mock_droplet.get_volume_delta.return_value = 0.0
+    for _ in range(30):
+        coordinator._on_update(None)
+
+    mock_droplet.get_flow_rate.return_value = 3.0
+    mock_droplet.get_volume_delta.return_value = 50.0
+    for _ in range(10):
+        coordinator._on_update(None)
+
+    assert coordinator.flow_samples_count == 40
+    assert coordinator.avg_flow_1h == pytest.approx(0.75)
+
+
+async def test_keepalive_update_skips_notify(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test frames without flow or volume changes are coalesced."""
+    coordinator = mock_setup_entry.runtime_data
+    mock_droplet.get_flow_rate.return_value = 0.0
+    mock_droplet.get_volume_delta.return_value = 0.0
+    coordinator._on_update(None)
+    samples = coordinator.flow_samples_count
+
+    with patch.object(coordinator, "async_set_updated_data") as mock_notify:
+        coordinator._on_update(None)
+        mock_notify.assert_not_called()
+        # Unchanged flow is still sampled for the windowed statistics
+        assert coordinator.flow_samples_count == samples + 1
+
+        mock_droplet.get_volume_delta.return_value = 5.0
+        coordinator._on_update(None)
+        mock_notify.assert_called_once()
+
+
+async def test_accumulators_read_only_when_volume_arrives(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test accumulator readings are cached between volume updates."""
+    coordinator = mock_setup_entry.runtime_data
+    mock_droplet.get_volume_delta.return_value = 0.0
+    mock_droplet.get_accumulated_volume.reset_mock()
+
+    coordinator._on_update(None)
+    assert mock_droplet.get_accumulated_volume.call_count == 0
+
+    mock_droplet._accumulated_volumes["daily"] = 250.0
+    mock_droplet.get_volume_delta.return_value = 250.0
+    coordinator._on_update(None)
+    assert mock_droplet.get_accumulated_volume.call_count == 6
+
+    assert coordinator.daily_volume == pytest.approx(0.25)
+    assert coordinator.daily_cost is not None
+    assert mock_droplet.get_accumulated_volume.call_count == 6
+
+
+async def test_rounded_values_refreshed_on_update(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test published values are rounded once per listener update."""
+    coordinator = mock_setup_entry.runtime_data
+    coordinator._baseline_daily = 1.23456
+
+    assert coordinator.rounded_values["daily_volume"] != 1.235
+    coordinator.async_update_listeners()
+
+    assert coordinator.rounded_values["daily_volume"] == 1.235
+    assert coordinator.rounded_values["avg_flow_1h"] is None
 
 
 async def test_hourly_flow_stats_tracking(
@@ -176,12 +306,32 @@ async def test_cost_calculation_metric(
         mock_setup_entry,
         options={**mock_setup_entry.options, "water_tariff": 5.0},
     )
+    await hass.async_block_till_done()
 
     # Simulate 1000L = 1m³ via baseline
     coordinator._baseline_daily = 1000.0
     assert coordinator.daily_cost == pytest.approx(5.0)
 
 
+async def test_cost_calculation_follows_unit_system(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test the cached cost factor is refreshed when the unit system changes."""
+    coordinator = mock_setup_entry.runtime_data
+
+    hass.config_entries.async_update_entry(
+        mock_setup_entry,
+        options={**mock_setup_entry.options, "water_tariff": 2.0},
+    )
+    await hass.config.async_update(unit_system="us_customary")
+    await hass.async_block_till_done()
+
+    # 1 gallon at 2.0 per gallon
+    coordinator._baseline_daily = 3.78541
+    assert coordinator.daily_cost == pytest.approx(2.0)
+
+
 async def test_cost_calculation_zero_tariff(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -223,12 +373,15 @@ async def test_leak_detection_triggered(
 
     # Set threshold to 0 (default)
     # Set hourly flow stats with min > 0
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
 
-    # Evaluate leak
-    coordinator._evaluate_leak()
+    # Evaluate leak; the event entity would consume the event on the signal
+    with patch("custom_components.droplet_plus.coordinator.async_dispatcher_send") as mock_send:
+        coordinator._evaluate_leak()
 
+    mock_send.assert_called_once_with(hass, coordinator.leak_event_signal)
     assert coordinator.water_leak_detected is True
     assert coordinator.pending_leak_event is not None
     assert coordinator.pending_leak_event[0] == EVENT_WATER_LEAK_DETECTED
@@ -242,11 +395,14 @@ async def test_leak_detection_cleared(
     coordinator = mock_setup_entry.runtime_data
     coordinator._water_leak_detected = True
 
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.0) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.0)
 
-    coordinator._evaluate_leak()
+    with patch("custom_components.droplet_plus.coordinator.async_dispatcher_send") as mock_send:
+        coordinator._evaluate_leak()
 
+    mock_send.assert_called_once_with(hass, coordinator.leak_event_signal)
     assert coordinator.water_leak_detected is False
     assert coordinator.pending_leak_event is not None
     assert coordinator.pending_leak_event[0] == EVENT_WATER_LEAK_CLEARED
@@ -265,6 +421,28 @@ async def test_leak_no_change(
     assert coordinator.pending_leak_event is None
 
 
+async def test_leak_evaluated_at_hour_boundary(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test leak detection runs when an hour is finalized, not on every frame."""
+    coordinator = mock_setup_entry.runtime_data
+    now_ts = hass.loop.time()
+    for i in reversed(range(1, 24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
+
+    mock_droplet.get_flow_rate.return_value = 1.0
+    mock_droplet.get_volume_delta.return_value = 10.0
+    coordinator._on_update(None)
+    assert coordinator.water_leak_detected is False
+
+    coordinator._hourly_reset = dt_util.now() - timedelta(hours=1)
+    coordinator._update_period_cache()
+    coordinator._on_update(None)
+    assert coordinator.water_leak_detected is True
+
+
 async def test_consume_leak_event(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -280,6 +458,48 @@ async def test_consume_leak_event(
     assert coordinator.pending_leak_event is None
 
 
+async def test_save_scheduled_once_per_dirty_period(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test updates schedule a single delayed save until the store writes."""
+    coordinator = mock_setup_entry.runtime_data
+    mock_droplet.get_volume_delta.return_value = 10.0
+
+    with patch.object(coordinator._store, "async_delay_save") as mock_delay_save:
+        coordinator._on_update(None)
+        coordinator._on_update(None)
+        assert mock_delay_save.call_count == 1
+
+        # The store collects the data when it writes, clearing the flag
+        data_func = mock_delay_save.call_args[0][0]
+        assert "lifetime_volume" in data_func()
+
+        coordinator._on_update(None)
+        assert mock_delay_save.call_count == 2
+
+
+async def test_setup_waits_for_metadata_from_update(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test first refresh resumes as soon as an update brings metadata."""
+    mock_droplet.version_info_available.return_value = False
+    coordinator = DropletCoordinator(hass, mock_setup_entry)
+
+    setup_task = hass.async_create_task(coordinator._async_setup())
+    await asyncio.sleep(0)
+    assert not setup_task.done()
+
+    mock_droplet.version_info_available.return_value = True
+    coordinator._on_update(None)
+    await setup_task
+
+    assert coordinator._metadata_event.is_set()
+
+
 async def test_persistence_save_load(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
@@ -308,24 +528,94 @@ async def test_persistence_save_load(
     assert coordinator._water_leak_detected is True
 
 
+async def test_persistence_buffers_round_trip(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test statistics buffers survive a save and load into a new coordinator."""
+    coordinator = mock_setup_entry.runtime_data
+    now_ts = hass.loop.time()
+
+    coordinator._flow_samples.append(now_ts - 60, 1.5)
+    coordinator._record_hourly_consumption(now_ts - 3600, 12.0)
+    coordinator._record_hourly_flow_stats(now_ts - 3600, 3.0, 0.5)
+    saved = coordinator._data_to_save()
+    [saved_ts] = unpack_floats(saved["flow_samples"]["ts"])
+    assert saved_ts == pytest.approx(time.time() - 60, abs=1)
+    await coordinator._async_save_data()
+
+    restored = DropletCoordinator(hass, mock_setup_entry)
+    await restored._async_load_data()
+
+    # Timestamps are stored as epoch and mapped back onto the loop clock
+    [(flow_ts, flow)] = restored._flow_samples
+    assert flow_ts == pytest.approx(now_ts - 60, abs=1)
+    assert flow == 1.5
+    assert restored.peak_hourly_24h == pytest.approx(12.0)
+    [(stats_ts, max_flow, min_flow)] = restored._hourly_flow_stats
+    assert stats_ts == pytest.approx(now_ts - 3600, abs=1)
+    assert (max_flow, min_flow) == (3.0, 0.5)
+    assert restored.min_flow_24h == pytest.approx(0.5)
+
+
 async def test_buffer_trimming(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
 ) -> None:
     """Test buffer trimming removes old entries."""
     coordinator = mock_setup_entry.runtime_data
-    now_ts = dt_util.now().timestamp()
+    now_ts = hass.loop.time()
 
     # Add old and new flow samples
-    coordinator._flow_samples = [
-        (now_ts - 7200, 1.0),  # 2h old (should be trimmed)
-        (now_ts - 1800, 2.0),  # 30min old (should remain)
-    ]
+    coordinator._flow_samples.append(now_ts - 7200, 1.0)  # 2h old (should be trimmed)
+    coordinator._flow_samples.append(now_ts - 1800, 2.0)  # 30min old (should remain)
+
+    # Hourly peaks: 2 days old (outside 24h, inside 7d) and 1h old
+    coordinator._record_hourly_flow_stats(now_ts - 2 * 86400, 9.0, 0.0)
+    coordinator._record_hourly_flow_stats(now_ts - 3600, 3.0, 0.5)
 
     coordinator._trim_buffers(now_ts)
 
     assert len(coordinator._flow_samples) == 1
-    assert coordinator._flow_samples[0][1] == 2.0
+    assert coordinator.avg_flow_1h == 2.0
+    assert coordinator.peak_flow_24h == 3.0
+    assert coordinator.peak_flow_7d == 9.0
+    assert coordinator.min_flow_24h == 0.5
+    assert coordinator.hourly_flow_stats_count == 2
+
+
+async def test_storage_migrates_row_buffers_to_columns(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test minor version 1 row buffers are migrated to packed columns on load."""
+    key = "droplet_plus_data_migration"
+    hass_storage[key] = {
+        "version": 1,
+        "minor_version": 1,
+        "key": key,
+        "data": {
+            "lifetime_volume": 10.0,
+            "flow_samples": [[100.0, 1.5], [101.0, 2.5]],
+            "hourly_flow_stats": [[100.0, 3.0, 0.5]],
+        },
+    }
+
+    store = _DropletStore(hass, 1, key, minor_version=STORAGE_MINOR_VERSION)
+    data = await store.async_load()
+
+    assert data is not None
+    assert data["lifetime_volume"] == 10.0
+    assert data["flow_samples"] == {
+        "ts": pack_floats([100.0, 101.0]),
+        "value": pack_floats([1.5, 2.5]),
+    }
+    assert data["hourly_consumption"] == {"ts": "", "value": ""}
+    assert data["hourly_flow_stats"] == {
+        "ts": pack_floats([100.0]),
+        "max": pack_floats([3.0]),
+        "min": pack_floats([0.5]),
+    }
 
 
 async def test_accumulators_registered_on_setup(
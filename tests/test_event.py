@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+from typing import Any
 from unittest.mock import MagicMock
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.droplet_plus.const import DOMAIN
+from custom_components.droplet_plus.const import (
+    DOMAIN,
+    EVENT_WATER_LEAK_CLEARED,
+    EVENT_WATER_LEAK_DETECTED,
+    STORAGE_KEY,
+    STORAGE_MINOR_VERSION,
+    STORAGE_VERSION,
+)
+from custom_components.droplet_plus.helpers import pack_floats
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.util import dt as dt_util
 
 
@@ -43,10 +53,10 @@ async def test_event_fires_on_leak_detected(
     coordinator = mock_setup_entry.runtime_data
 
     # Simulate leak detection
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
     coordinator._evaluate_leak()
-    coordinator.async_set_updated_data(None)
     await hass.async_block_till_done()
 
     # Verify event was consumed
@@ -63,11 +73,77 @@ async def test_event_fires_on_leak_cleared(
     coordinator = mock_setup_entry.runtime_data
     coordinator._water_leak_detected = True
 
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.0) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.0)
     coordinator._evaluate_leak()
-    coordinator.async_set_updated_data(None)
     await hass.async_block_till_done()
 
     assert coordinator.pending_leak_event is None
     assert coordinator.water_leak_detected is False
+
+
+async def test_event_state_written_only_on_change(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test routine updates do not rewrite the event entity state."""
+    coordinator = mock_setup_entry.runtime_data
+    ent_reg = er.async_get(hass)
+    events = [e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "event"]
+    entity_id = events[0].entity_id
+    before = hass.states.get(entity_id)
+
+    coordinator.async_set_updated_data(None)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).last_reported == before.last_reported
+
+    coordinator._pending_leak_event = (EVENT_WATER_LEAK_DETECTED, {"min_flow": 0.5})
+    async_dispatcher_send(hass, coordinator.leak_event_signal)
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state.attributes["event_type"] == EVENT_WATER_LEAK_DETECTED
+
+    coordinator.available = False
+    coordinator.async_set_updated_data(None)
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "unavailable"
+
+
+async def test_event_fires_for_leak_transition_at_startup(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test a leak transition found in stored data fires once the entity is added."""
+    # Stored as leaking, but the last day of hourly stats shows no leak flow
+    now_ts = dt_util.utcnow().timestamp()
+    key = f"{STORAGE_KEY}_{mock_config_entry.entry_id}"
+    hass_storage[key] = {
+        "version": STORAGE_VERSION,
+        "minor_version": STORAGE_MINOR_VERSION,
+        "key": key,
+        "data": {
+            "water_leak_detected": True,
+            "hourly_flow_stats": {
+                "ts": pack_floats([now_ts - 7200, now_ts - 3600]),
+                "max": pack_floats([2.0, 2.0]),
+                "min": pack_floats([0.0, 0.0]),
+            },
+        },
+    }
+
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.water_leak_detected is False
+    assert coordinator.pending_leak_event is None
+
+    ent_reg = er.async_get(hass)
+    events = [e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "event"]
+    state = hass.states.get(events[0].entity_id)
+    assert state.attributes["event_type"] == EVENT_WATER_LEAK_CLEARED
@@ -7,20 +7,24 @@ from datetime import UTC, datetime
 import pytest
 
 from custom_components.droplet_plus.helpers import (
-    compute_average,
-    compute_max,
-    compute_min,
-    is_new_day,
-    is_new_hour,
-    is_new_month,
-    is_new_week,
-    is_new_year,
+    BOUNDARY_DAY,
+    BOUNDARY_HOUR,
+    BOUNDARY_MONTH,
+    BOUNDARY_WEEK,
+    BOUNDARY_YEAR,
+    RollingWindow,
+    crossed_boundaries,
+    from_columns,
+    is_valid_pairing_code,
     next_day,
     next_hour,
     next_month,
     next_week,
     next_year,
     normalize_pairing_code,
+    pack_floats,
+    to_columns,
+    unpack_floats,
 )
 
 
@@ -44,129 +48,159 @@ class TestNormalizePairingCode:
         assert normalize_pairing_code("aB cD 12") == "ABCD12"
 
 
+class TestIsValidPairingCode:
+    """Tests for is_valid_pairing_code."""
+
+    def test_valid(self) -> None:
+        """Test a normalized alphanumeric code is valid."""
+        assert is_valid_pairing_code("ABCD1234") is True
+
+    def test_empty(self) -> None:
+        """Test an empty code is invalid."""
+        assert is_valid_pairing_code("") is False
+
+    def test_separators_left_to_device(self) -> None:
+        """Test codes with separators are passed on for the device to check."""
+        assert is_valid_pairing_code("ABCD-1234") is True
+
+
 class TestPeriodBoundaries:
     """Tests for period boundary detection."""
 
-    def test_is_new_hour_same(self) -> None:
-        """Test same hour returns False."""
-        last = datetime(2024, 1, 15, 10, 30, tzinfo=UTC)
-        now = datetime(2024, 1, 15, 10, 45, tzinfo=UTC)
-        assert is_new_hour(last, now) is False
-
-    def test_is_new_hour_different(self) -> None:
-        """Test different hour returns True."""
-        last = datetime(2024, 1, 15, 10, 59, tzinfo=UTC)
-        now = datetime(2024, 1, 15, 11, 0, tzinfo=UTC)
-        assert is_new_hour(last, now) is True
-
-    def test_is_new_day_same(self) -> None:
-        """Test same day returns False."""
-        last = datetime(2024, 1, 15, 10, 0, tzinfo=UTC)
-        now = datetime(2024, 1, 15, 23, 59, tzinfo=UTC)
-        assert is_new_day(last, now) is False
-
-    def test_is_new_day_different(self) -> None:
-        """Test different day returns True."""
-        last = datetime(2024, 1, 15, 23, 59, tzinfo=UTC)
-        now = datetime(2024, 1, 16, 0, 0, tzinfo=UTC)
-        assert is_new_day(last, now) is True
-
-    def test_is_new_week_same(self) -> None:
-        """Test same ISO week returns False."""
-        last = datetime(2024, 1, 15, tzinfo=UTC)  # Monday, week 3
-        now = datetime(2024, 1, 21, tzinfo=UTC)  # Sunday, week 3
-        assert is_new_week(last, now) is False
-
-    def test_is_new_week_different(self) -> None:
-        """Test different ISO week returns True."""
-        last = datetime(2024, 1, 21, tzinfo=UTC)  # Sunday, week 3
-        now = datetime(2024, 1, 22, tzinfo=UTC)  # Monday, week 4
-        assert is_new_week(last, now) is True
-
-    def test_is_new_month_same(self) -> None:
-        """Test same month returns False."""
-        last = datetime(2024, 1, 1, tzinfo=UTC)
-        now = datetime(2024, 1, 31, tzinfo=UTC)
-        assert is_new_month(last, now) is False
-
-    def test_is_new_month_different(self) -> None:
-        """Test different month returns True."""
-        last = datetime(2024, 1, 31, tzinfo=UTC)
-        now = datetime(2024, 2, 1, tzinfo=UTC)
-        assert is_new_month(last, now) is True
-
-    def test_is_new_year_same(self) -> None:
-        """Test same year returns False."""
-        last = datetime(2024, 1, 1, tzinfo=UTC)
-        now = datetime(2024, 12, 31, tzinfo=UTC)
-        assert is_new_year(last, now) is False
-
-    def test_is_new_year_different(self) -> None:
-        """Test different year returns True."""
-        last = datetime(2024, 12, 31, tzinfo=UTC)
-        now = datetime(2025, 1, 1, tzinfo=UTC)
-        assert is_new_year(last, now) is True
-
-    def test_is_new_hour_year_crossing(self) -> None:
-        """Test hour boundary across year change."""
-        last = datetime(2024, 12, 31, 23, 30, tzinfo=UTC)
-        now = datetime(2025, 1, 1, 0, 0, tzinfo=UTC)
-        assert is_new_hour(last, now) is True
-
-
-class TestStatisticsComputation:
-    """Tests for statistics computation functions."""
-
-    def test_compute_average_basic(self) -> None:
+    def test_crossed_boundaries_none(self) -> None:
+        """Test no bits are set before the earliest boundary."""
+        assert crossed_boundaries(99.0, (100.0, 200.0, 300.0, 400.0, 500.0)) == 0
+
+    def test_crossed_boundaries_hour_and_day(self) -> None:
+        """Test bits are set for every boundary that has been reached."""
+        bits = crossed_boundaries(200.0, (100.0, 200.0, 300.0, 400.0, 500.0))
+        assert bits == BOUNDARY_HOUR | BOUNDARY_DAY
+        assert not bits & BOUNDARY_WEEK
+
+    def test_crossed_boundaries_all(self) -> None:
+        """Test all bits are set once the year boundary is reached."""
+        bits = crossed_boundaries(500.0, (100.0, 200.0, 300.0, 400.0, 500.0))
+        assert bits == (
+            BOUNDARY_HOUR | BOUNDARY_DAY | BOUNDARY_WEEK | BOUNDARY_MONTH | BOUNDARY_YEAR
+        )
+
+
+class TestRollingWindow:
+    """Tests for the RollingWindow statistics buffer."""
+
+    @staticmethod
+    def _window(max_age: float, samples: list[tuple[float, float]]) -> RollingWindow:
+        window = RollingWindow(max_age)
+        for ts, value in samples:
+            window.append(ts, value)
+        return window
+
+    def test_average_basic(self) -> None:
         """Test basic average computation."""
-        samples = [(100.0, 1.0), (200.0, 3.0), (300.0, 5.0)]
-        result = compute_average(samples, 500, 400.0)
-        assert result == pytest.approx(3.0)
+        window = self._window(500, [(100.0, 1.0), (200.0, 3.0), (300.0, 5.0)])
+        window.expire(400.0)
+        assert window.average == pytest.approx(3.0)
 
-    def test_compute_average_with_expired(self) -> None:
+    def test_average_with_expired(self) -> None:
         """Test average ignores expired samples."""
-        samples = [(50.0, 10.0), (200.0, 2.0), (300.0, 4.0)]
-        result = compute_average(samples, 200, 350.0)
-        assert result == pytest.approx(3.0)
-
-    def test_compute_average_empty(self) -> None:
-        """Test average returns None for no valid samples."""
-        samples = [(100.0, 5.0)]
-        result = compute_average(samples, 10, 200.0)
-        assert result is None
-
-    def test_compute_average_all_expired(self) -> None:
-        """Test average returns None when all samples expired."""
-        result = compute_average([], 100, 200.0)
-        assert result is None
-
-    def test_compute_max_basic(self) -> None:
+        window = self._window(200, [(50.0, 10.0), (200.0, 2.0), (300.0, 4.0)])
+        window.expire(350.0)
+        assert window.average == pytest.approx(3.0)
+        assert len(window) == 2
+
+    def test_all_expired(self) -> None:
+        """Test statistics return None once every sample expired."""
+        window = self._window(10, [(100.0, 5.0)])
+        window.expire(200.0)
+        assert window.average is None
+        assert window.maximum is None
+        assert window.minimum is None
+        assert len(window) == 0
+
+    def test_average_exact_after_expiring_into_zeros(self) -> None:
+        """Test rounding error is discarded once only zero samples remain."""
+        values = [0.1, 0.7, 2.3, 0.3, 1.9, 0.2] * 50
+        samples = [(float(ts), value) for ts, value in enumerate(values)]
+        samples += [(float(ts), 0.0) for ts in range(len(values), len(values) + 20)]
+        window = self._window(10, samples)
+        window.expire(float(len(values) + 19))
+        assert window.maximum == 0.0
+        assert window.average == 0.0
+
+    def test_empty(self) -> None:
+        """Test statistics return None for an empty window."""
+        window = RollingWindow(100)
+        assert window.average is None
+        assert window.maximum is None
+        assert window.minimum is None
+
+    def test_max_basic(self) -> None:
         """Test basic max computation."""
-        samples = [(100.0, 1.0), (200.0, 5.0), (300.0, 3.0)]
-        result = compute_max(samples, 500, 400.0)
-        assert result == pytest.approx(5.0)
-
-    def test_compute_max_empty(self) -> None:
-        """Test max returns None for no valid samples."""
-        result = compute_max([], 100, 200.0)
-        assert result is None
-
-    def test_compute_min_basic(self) -> None:
+        window = self._window(500, [(100.0, 1.0), (200.0, 5.0), (300.0, 3.0)])
+        assert window.maximum == pytest.approx(5.0)
+
+    def test_max_with_expired(self) -> None:
+        """Test max falls back to the next candidate when the peak expires."""
+        window = self._window(200, [(50.0, 9.0), (200.0, 2.0), (300.0, 4.0), (310.0, 1.0)])
+        assert window.maximum == pytest.approx(9.0)
+        window.expire(350.0)
+        assert window.maximum == pytest.approx(4.0)
+        window.expire(505.0)
+        assert window.maximum == pytest.approx(1.0)
+
+    def test_min_basic(self) -> None:
         """Test basic min computation."""
-        samples = [(100.0, 3.0), (200.0, 1.0), (300.0, 5.0)]
-        result = compute_min(samples, 500, 400.0)
-        assert result == pytest.approx(1.0)
+        window = self._window(500, [(100.0, 3.0), (200.0, 1.0), (300.0, 5.0)])
+        assert window.minimum == pytest.approx(1.0)
 
-    def test_compute_min_empty(self) -> None:
-        """Test min returns None for no valid samples."""
-        result = compute_min([], 100, 200.0)
-        assert result is None
-
-    def test_compute_min_with_expired(self) -> None:
+    def test_min_with_expired(self) -> None:
         """Test min ignores expired samples."""
-        samples = [(50.0, 0.1), (200.0, 2.0), (300.0, 3.0)]
-        result = compute_min(samples, 200, 350.0)
-        assert result == pytest.approx(2.0)
+        window = self._window(200, [(50.0, 0.1), (200.0, 2.0), (300.0, 3.0)])
+        window.expire(350.0)
+        assert window.minimum == pytest.approx(2.0)
+
+    def test_max_samples_evicts_oldest(self) -> None:
+        """Test a full window evicts its oldest sample and its candidates."""
+        window = RollingWindow(1000, max_samples=2)
+        for ts, value in [(100.0, 9.0), (200.0, 0.5), (300.0, 4.0)]:
+            window.append(ts, value)
+        assert list(window) == [(200.0, 0.5), (300.0, 4.0)]
+        assert window.average == pytest.approx(2.25)
+        assert window.maximum == pytest.approx(4.0)
+        assert window.minimum == pytest.approx(0.5)
+
+    def test_iterates_samples_in_order(self) -> None:
+        """Test iteration yields the retained samples oldest first."""
+        samples = [(100.0, 3.0), (200.0, 1.0), (300.0, 5.0)]
+        window = self._window(500, samples)
+        assert list(window) == samples
+
+
+class TestColumns:
+    """Tests for the storage column helpers."""
+
+    def test_round_trip(self) -> None:
+        """Test rows survive a round trip through columns."""
+        rows = [(100.0, 3.0, 0.5), (200.0, 4.0, 0.0)]
+        columns = to_columns(rows, ("ts", "max", "min"))
+        assert columns == {"ts": (100.0, 200.0), "max": (3.0, 4.0), "min": (0.5, 0.0)}
+        assert list(from_columns(columns, ("ts", "max", "min"))) == rows
+
+    def test_empty(self) -> None:
+        """Test empty buffers produce empty columns and no rows."""
+        columns = to_columns([], ("ts", "value"))
+        assert columns == {"ts": (), "value": ()}
+        assert list(from_columns({}, ("ts", "value"))) == []
+
+    def test_pack_round_trip(self) -> None:
+        """Test packed floats unpack to the same values."""
+        values = [1.5, -0.25, 1_700_000_000.123]
+        assert list(unpack_floats(pack_floats(values))) == values
+
+    def test_pack_is_little_endian(self) -> None:
+        """Test packed floats use a fixed byte order."""
+        assert pack_floats([1.0]) == "AAAAAAAA8D8="
+        assert pack_floats([]) == ""
 
 
 class TestNextBoundary:
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock
+from importlib import import_module
+from unittest.mock import MagicMock, patch
 
+import pytest
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.droplet_plus.const import DOMAIN
+from custom_components.droplet_plus import PLATFORMS
 from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 
 
 async def test_setup_entry(
@@ -22,15 +25,35 @@ async def test_setup_entry(
 
 
 async def test_setup_entry_registers_device(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
+    droplet_device: dr.DeviceEntry | None,
 ) -> None:
     """Test setup registers a device in the device registry."""
-    device_registry = dr.async_get(hass)
-    device = device_registry.async_get_device(identifiers={(DOMAIN, mock_setup_entry.unique_id)})
-    assert device is not None
-    assert device.manufacturer == "LIXIL"
-    assert device.model == "Droplet"
+    assert droplet_device is not None
+    assert droplet_device.manufacturer == "LIXIL"
+    assert droplet_device.model == "Droplet"
+
+
+async def test_setup_entry_names_device_before_metadata(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    mock_config_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+) -> None:
+    """Test entities registered before metadata arrives keep the device-name prefix."""
+    mock_droplet.version_info_available.return_value = False
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.droplet_plus.coordinator.FW_VERSION_TIMEOUT", 0.5):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    sensor_ids = [
+        e.entity_id
+        for e in er.async_entries_for_config_entry(entity_registry, mock_config_entry.entry_id)
+        if e.domain == "sensor"
+    ]
+    assert sensor_ids
+    assert all(entity_id.startswith("sensor.droplet_192_168_1_100_") for entity_id in sensor_ids)
 
 
 async def test_unload_entry(
@@ -64,3 +87,11 @@ async def test_unload_saves_data(
 
     # Verify data was saved (store.async_save was called)
     assert mock_setup_entry.state is ConfigEntryState.NOT_LOADED
+
+
+@pytest.mark.parametrize("platform", PLATFORMS)
+def test_platforms_set_parallel_updates(platform: Platform) -> None:
+    """Test every forwarded platform declares PARALLEL_UPDATES."""
+    module = import_module(f"custom_components.droplet_plus.{platform}")
+    parallel_updates = module.PARALLEL_UPDATES
+    assert parallel_updates == (1 if platform is Platform.NUMBER else 0)
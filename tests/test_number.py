@@ -2,17 +2,22 @@
 
 from __future__ import annotations
 
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from datetime import timedelta
+from unittest.mock import patch
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_fire_time_changed
 
 from custom_components.droplet_plus.const import (
     CONF_WATER_LEAK_THRESHOLD,
     CONF_WATER_TARIFF,
     DOMAIN,
 )
+from custom_components.droplet_plus.number import _get_tariff_descriptions
 from homeassistant.components.number import ATTR_VALUE, SERVICE_SET_VALUE
 from homeassistant.const import ATTR_ENTITY_ID, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
 
 
 async def test_number_entities_exist(
@@ -101,3 +106,67 @@ async def test_set_leak_threshold_value(
     await hass.async_block_till_done()
 
     assert mock_setup_entry.options[CONF_WATER_LEAK_THRESHOLD] == 0.05
+
+
+async def test_tariff_descriptions_cached(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test tariff descriptions are built once per currency and unit system."""
+    descriptions = _get_tariff_descriptions(hass)
+    assert _get_tariff_descriptions(hass) is descriptions
+    assert descriptions[0].native_unit_of_measurement == f"{hass.config.currency}/m³"
+
+
+async def test_rapid_option_writes_coalesced(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test option changes within the cooldown produce one trailing entry update."""
+    coordinator = mock_setup_entry.runtime_data
+
+    with patch.object(
+        hass.config_entries,
+        "async_update_entry",
+        wraps=hass.config_entries.async_update_entry,
+    ) as mock_update:
+        await coordinator.async_set_option(CONF_WATER_TARIFF, 1.0)
+        await coordinator.async_set_option(CONF_WATER_TARIFF, 2.0)
+        await coordinator.async_set_option(CONF_WATER_TARIFF, 3.0)
+        assert mock_update.call_count == 1
+        assert mock_setup_entry.options[CONF_WATER_TARIFF] == 1.0
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=1))
+        await hass.async_block_till_done()
+        assert mock_update.call_count == 2
+
+    assert mock_setup_entry.options[CONF_WATER_TARIFF] == 3.0
+
+
+async def test_pending_option_flushed_on_unload(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a queued option change is written when the entry unloads."""
+    coordinator = mock_setup_entry.runtime_data
+    await coordinator.async_set_option(CONF_WATER_TARIFF, 1.0)
+    await coordinator.async_set_option(CONF_WATER_LEAK_THRESHOLD, 0.5)
+
+    await hass.config_entries.async_unload(mock_setup_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_setup_entry.options[CONF_WATER_LEAK_THRESHOLD] == 0.5
+
+
+async def test_unchanged_option_not_written(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test setting an option to its current value skips the entry update."""
+    coordinator = mock_setup_entry.runtime_data
+    current = mock_setup_entry.options[CONF_WATER_TARIFF]
+
+    with patch.object(hass.config_entries, "async_update_entry") as mock_update:
+        await coordinator.async_set_option(CONF_WATER_TARIFF, current)
+
+    mock_update.assert_not_called()
@@ -9,7 +9,6 @@ from pytest_homeassistant_custom_component.common import MockConfigEntry
 from custom_components.droplet_plus.const import DOMAIN, EVENT_WATER_LEAK_DETECTED
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.issue_registry import async_get as async_get_issue_registry
-from homeassistant.util import dt as dt_util
 
 
 async def test_repair_created_on_leak(
@@ -20,9 +19,11 @@ async def test_repair_created_on_leak(
     """Test repair issue is created when leak is detected."""
     coordinator = mock_setup_entry.runtime_data
 
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
     coordinator._evaluate_leak()
+    await hass.async_block_till_done()
 
     issue_registry = async_get_issue_registry(hass)
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
@@ -38,17 +39,20 @@ async def test_repair_resolved_on_clear(
     coordinator = mock_setup_entry.runtime_data
 
     # First, trigger a leak
-    now_ts = dt_util.now().timestamp()
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.5) for i in range(24)]
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
     coordinator._evaluate_leak()
+    await hass.async_block_till_done()
 
     issue_registry = async_get_issue_registry(hass)
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
     assert issue is not None
 
     # Now clear the leak
-    coordinator._hourly_flow_stats = [(now_ts - 3600 * i, 2.0, 0.0) for i in range(24)]
+    coordinator._record_hourly_flow_stats(now_ts, 2.0, 0.0)
     coordinator._evaluate_leak()
+    await hass.async_block_till_done()
 
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
     assert issue is None
@@ -61,7 +65,30 @@ async def test_no_repair_when_no_leak(
     """Test no repair issue when no leak."""
     coordinator = mock_setup_entry.runtime_data
     coordinator._evaluate_leak()
+    await hass.async_block_till_done()
 
     issue_registry = async_get_issue_registry(hass)
     issue = issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED)
     assert issue is None
+
+
+async def test_repair_updates_coalesced(
+    hass: HomeAssistant,
+    mock_setup_entry: MockConfigEntry,
+) -> None:
+    """Test a leak that clears before the deferred update leaves no issue."""
+    coordinator = mock_setup_entry.runtime_data
+
+    now_ts = hass.loop.time()
+    for i in reversed(range(24)):
+        coordinator._record_hourly_flow_stats(now_ts - 3600 * i, 2.0, 0.5)
+    coordinator._evaluate_leak()
+    coordinator._record_hourly_flow_stats(now_ts, 2.0, 0.0)
+    coordinator._evaluate_leak()
+
+    issue_registry = async_get_issue_registry(hass)
+    assert issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED) is None
+
+    await hass.async_block_till_done()
+    assert issue_registry.async_get_issue(DOMAIN, EVENT_WATER_LEAK_DETECTED) is None
+    assert coordinator._leak_issue_update_scheduled is False
@@ -6,7 +6,15 @@ from unittest.mock import MagicMock
 
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.droplet_plus.const import DOMAIN
+from custom_components.droplet_plus.const import (
+    KEY_SERVER_STATUS,
+    KEY_SIGNAL_QUALITY,
+    KEY_WATER_AVG_FLOW_1H,
+    KEY_WATER_COST_DAILY,
+    KEY_WATER_FLOW_RATE,
+    KEY_WATER_VOLUME_DELTA,
+)
+from custom_components.droplet_plus.sensor import SENSOR_DESCRIPTIONS
 from homeassistant.const import EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
@@ -16,183 +24,112 @@ async def test_flow_rate_sensor(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
     mock_droplet: MagicMock,
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
     """Test water flow rate sensor after a device update."""
     coordinator = mock_setup_entry.runtime_data
 
-    # Trigger a device update so the coordinator captures the mock values
+    # Trigger a device update so the coordinator captures the mock values.
+    # Listeners are updated synchronously, so the state is written on return.
     coordinator._on_update(None)
-    await hass.async_block_till_done()
 
-    states = [s for s in hass.states.async_all("sensor") if "flow_rate" in s.entity_id]
-    assert len(states) > 0
-    state = states[0]
+    state = hass.states.get(droplet_sensors[KEY_WATER_FLOW_RATE].entity_id)
+    assert state is not None
     assert state.state == "2.5"
 
 
-async def test_volume_delta_sensor_disabled_by_default(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
-) -> None:
-    """Test water volume delta sensor is disabled by default."""
-    ent_reg = er.async_get(hass)
-    entries = [
-        e
-        for e in ent_reg.entities.values()
-        if e.platform == DOMAIN and "volume_delta" in e.entity_id
-    ]
-    # Disabled by default means it should NOT have a state
-    assert len(entries) == 1
-    assert entries[0].disabled_by is not None
-
-
-async def test_server_status_sensor(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
-) -> None:
-    """Test server status sensor is diagnostic."""
-    ent_reg = er.async_get(hass)
-    entries = [
-        e
-        for e in ent_reg.entities.values()
-        if e.platform == DOMAIN and "server_status" in e.entity_id
-    ]
-    assert len(entries) == 1
-    assert entries[0].entity_category == EntityCategory.DIAGNOSTIC
-
-
-async def test_signal_quality_sensor(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
-) -> None:
-    """Test signal quality sensor is diagnostic."""
-    ent_reg = er.async_get(hass)
-    entries = [
-        e
-        for e in ent_reg.entities.values()
-        if e.platform == DOMAIN and "signal_quality" in e.entity_id
-    ]
-    assert len(entries) == 1
-    assert entries[0].entity_category == EntityCategory.DIAGNOSTIC
-
-
-async def test_consumption_sensors_exist(
+async def test_avg_flow_sensor_follows_idle_frames(
     hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
+    mock_droplet: MagicMock,
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
-    """Test all consumption period sensors are created."""
-    ent_reg = er.async_get(hass)
-    sensor_keys = [
-        e.entity_id
-        for e in ent_reg.entities.values()
-        if e.platform == DOMAIN and e.domain == "sensor"
-    ]
-
-    # Check period sensors exist
-    periods = ["hourly", "daily", "weekly", "monthly", "yearly", "lifetime"]
-    for period in periods:
-        matches = [s for s in sensor_keys if f"consumption_{period}" in s]
-        assert len(matches) == 1, f"Missing consumption_{period} sensor"
+    """Test the 1h average flow state drops while keepalive frames arrive."""
+    coordinator = mock_setup_entry.runtime_data
 
+    mock_droplet.get_flow_rate.return_value = 3.0
+    mock_droplet.get_volume_delta.return_value = 50.0
+    for _ in range(10):
+        coordinator._on_update(None)
 
-async def test_cost_sensors_exist(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
-) -> None:
-    """Test all cost sensors are created."""
-    ent_reg = er.async_get(hass)
-    sensor_keys = [
-        e.entity_id
-        for e in ent_reg.entities.values()
-        if e.platform == DOMAIN and e.domain == "sensor"
-    ]
+    mock_droplet.get_flow_rate.return_value = 0.0
+    mock_droplet.get_volume_delta.return_value = 0.0
+    for _ in range(90):
+        coordinator._on_update(None)
 
-    cost_periods = ["daily", "weekly", "monthly", "yearly", "lifetime"]
-    for period in cost_periods:
-        matches = [s for s in sensor_keys if f"cost_{period}" in s]
-        assert len(matches) == 1, f"Missing cost_{period} sensor"
+    state = hass.states.get(droplet_sensors[KEY_WATER_AVG_FLOW_1H].entity_id)
+    assert state is not None
+    assert float(state.state) == 0.3
 
 
-async def test_statistics_sensors_exist(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
+async def test_sensor_registry_properties(
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
-    """Test all statistics sensors are created."""
-    ent_reg = er.async_get(hass)
-    sensor_keys = [
-        e.entity_id
-        for e in ent_reg.entities.values()
-        if e.platform == DOMAIN and e.domain == "sensor"
-    ]
-
-    stat_keys = [
-        "avg_flow_1h",
-        "peak_flow_24h",
-        "peak_flow_7d",
-        "min_flow_24h",
-        "avg_hourly_24h",
-        "peak_hourly_24h",
-        "peak_hourly_7d",
-        "avg_daily_7d",
-        "avg_daily_30d",
-        "peak_daily_30d",
+    """Test entity category and default enablement of the device sensors."""
+    expected = [
+        (KEY_WATER_FLOW_RATE, None, False),
+        (KEY_WATER_VOLUME_DELTA, EntityCategory.DIAGNOSTIC, True),
+        (KEY_SERVER_STATUS, EntityCategory.DIAGNOSTIC, False),
+        (KEY_SIGNAL_QUALITY, EntityCategory.DIAGNOSTIC, False),
     ]
-    for key in stat_keys:
-        matches = [s for s in sensor_keys if key in s]
-        assert len(matches) == 1, f"Missing statistics sensor {key}"
+    for key, entity_category, disabled in expected:
+        entry = droplet_sensors[key]
+        assert entry.entity_category == entity_category, key
+        # Disabled by default means it should NOT have a state
+        assert (entry.disabled_by is not None) is disabled, key
 
 
-async def test_total_sensor_count(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
+async def test_sensors_match_descriptions(
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
-    """Test total number of sensor entities is 25."""
-    ent_reg = er.async_get(hass)
-    sensors = [
-        e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "sensor"
-    ]
-    assert len(sensors) == 25
+    """Test exactly one sensor entity is created per sensor description."""
+    assert droplet_sensors.keys() == {d.key for d in SENSOR_DESCRIPTIONS}
 
 
 async def test_sensor_has_entity_name(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
     """Test sensors use has_entity_name pattern."""
-    ent_reg = er.async_get(hass)
-    sensors = [
-        e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "sensor"
-    ]
-    for sensor in sensors:
+    for sensor in droplet_sensors.values():
         assert sensor.has_entity_name is True
 
 
 async def test_sensor_unique_ids(
-    hass: HomeAssistant,
     mock_setup_entry: MockConfigEntry,
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
     """Test sensors have unique IDs based on coordinator unique_id."""
-    ent_reg = er.async_get(hass)
-    sensors = [
-        e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "sensor"
-    ]
-    unique_ids = {s.unique_id for s in sensors}
-    assert len(unique_ids) == 25  # All unique
+    # Entries are keyed by description key, so each unique ID derived from
+    # its own key also proves the unique IDs are all distinct
+    assert len(droplet_sensors) == len(SENSOR_DESCRIPTIONS)
+    for key, sensor in droplet_sensors.items():
+        assert sensor.unique_id == f"{mock_setup_entry.unique_id}_{key}"
 
 
 async def test_sensor_device_association(
-    hass: HomeAssistant,
-    mock_setup_entry: MockConfigEntry,
+    entity_registry: er.EntityRegistry,
+    droplet_device: dr.DeviceEntry | None,
+    droplet_sensors: dict[str, er.RegistryEntry],
 ) -> None:
     """Test sensors are associated with the device."""
-    dev_reg = dr.async_get(hass)
-    ent_reg = er.async_get(hass)
+    assert droplet_device is not None
 
-    device = dev_reg.async_get_device(identifiers={(DOMAIN, mock_setup_entry.unique_id)})
-    assert device is not None
+    entries = er.async_entries_for_device(
+        entity_registry, droplet_device.id, include_disabled_entities=True
+    )
+    device_sensors = {e.entity_id for e in entries if e.domain == "sensor"}
+    assert device_sensors == {e.entity_id for e in droplet_sensors.values()}
 
-    sensors = [
-        e for e in ent_reg.entities.values() if e.platform == DOMAIN and e.domain == "sensor"
-    ]
-    for sensor in sensors:
-        assert sensor.device_id == device.id
+
+async def test_cost_sensor_follows_currency(
+    hass: HomeAssistant,
+    droplet_sensors: dict[str, er.RegistryEntry],
+) -> None:
+    """Test cost sensors use the configured currency and follow changes to it."""
+    entity_id = droplet_sensors[KEY_WATER_COST_DAILY].entity_id
+    assert hass.states.get(entity_id).attributes["unit_of_measurement"] == hass.config.currency
+
+    await hass.config.async_update(currency="USD")
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).attributes["unit_of_measurement"] == "USD"